@@ -0,0 +1,43 @@
+import { describe, it, expect, vi } from 'vitest';
+import { ensureTmux } from '../../ts-src/tmux/bootstrap.js';
+import { runCommand } from '../../ts-src/runtime/shell.js';
+
+// Mock platform detection
+vi.mock('../../ts-src/runtime/platform.js', () => ({
+  Platform: { WINDOWS: 'windows', MACOS: 'macos', LINUX: 'linux' },
+  detectPlatform: vi.fn(() => 'windows'),
+}));
+
+// Mock command execution
+vi.mock('../../ts-src/runtime/shell.js', () => ({
+  runCommand: vi.fn(),
+}));
+
+// Mock logger
+vi.mock('../../ts-src/utils/logger.js', () => ({
+  logger: { debug: vi.fn(), info: vi.fn(), warn: vi.fn(), error: vi.fn() },
+}));
+
+describe('ensureTmux', () => {
+  it('should run the WSL probe script as one sh -c argument via --exec', async () => {
+    vi.mocked(runCommand).mockResolvedValue({ exitCode: 0, stdout: '', stderr: '' });
+
+    await ensureTmux('Ubuntu');
+
+    const probe = vi.mocked(runCommand).mock.calls[0][0];
+    expect(probe.slice(0, 6)).toEqual(['wsl.exe', '-d', 'Ubuntu', '--exec', 'sh', '-c']);
+    expect(probe).toHaveLength(7);
+    expect(probe[6]).toContain('command -v tmux');
+    expect(probe).not.toContain('--');
+  });
+
+  it('should report a missing tmux when the probe fails', async () => {
+    vi.mocked(runCommand).mockResolvedValue({
+      exitCode: 1,
+      stdout: 'ID=ubuntu\n',
+      stderr: '',
+    });
+
+    await expect(ensureTmux('Debian')).rejects.toThrow('tmux is not installed');
+  });
+});
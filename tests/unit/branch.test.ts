@@ -0,0 +1,99 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import simpleGit from 'simple-git';
+import {
+  getLocalBranchSet,
+  listLocalBranches,
+  refreshBranchCache,
+} from '../../ts-src/git/branch.js';
+
+// Mock simple-git
+vi.mock('simple-git', () => ({
+  default: vi.fn(),
+}));
+
+// Mock logger
+vi.mock('../../ts-src/utils/logger.js', () => ({
+  logger: { debug: vi.fn(), info: vi.fn(), warn: vi.fn(), error: vi.fn() },
+}));
+
+const git = {
+  checkIsRepo: vi.fn(),
+  status: vi.fn(),
+  branch: vi.fn(),
+  fetch: vi.fn(),
+  branchLocal: vi.fn(),
+};
+
+describe('listLocalBranches cache', () => {
+  beforeEach(() => {
+    refreshBranchCache();
+    vi.clearAllMocks();
+    vi.mocked(simpleGit).mockReturnValue(git as never);
+    git.checkIsRepo.mockResolvedValue(true);
+    git.status.mockResolvedValue({ detached: false });
+    git.fetch.mockResolvedValue(undefined);
+    git.branch.mockImplementation((args: string[]) =>
+      Promise.resolve({ all: args.includes('-r') ? ['origin/main'] : ['main'] })
+    );
+  });
+
+  it('should reuse the listing for the same repository and fetch flag', async () => {
+    const first = await listLocalBranches('/repo');
+    const second = await listLocalBranches('/repo', { fetch: true });
+
+    expect(second).toBe(first);
+    expect(first.branches).toEqual(['main', 'origin/main']);
+    expect(git.checkIsRepo).toHaveBeenCalledTimes(1);
+    expect(git.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not serve an unfetched listing to a fetching caller', async () => {
+    await listLocalBranches('/repo', { fetch: false });
+    expect(git.fetch).not.toHaveBeenCalled();
+
+    await listLocalBranches('/repo', { fetch: true });
+
+    expect(git.checkIsRepo).toHaveBeenCalledTimes(2);
+    expect(git.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('should evict a rejected load so the next call retries', async () => {
+    git.checkIsRepo.mockResolvedValueOnce(false);
+
+    await expect(listLocalBranches('/repo')).rejects.toThrow('Not a git repository');
+    const result = await listLocalBranches('/repo');
+
+    expect(result.branches).toEqual(['main', 'origin/main']);
+    expect(git.checkIsRepo).toHaveBeenCalledTimes(2);
+  });
+
+  it('should drop both listings when a repository is refreshed', async () => {
+    await listLocalBranches('/repo', { fetch: false });
+    await listLocalBranches('/repo', { fetch: true });
+
+    refreshBranchCache('/repo');
+    await listLocalBranches('/repo', { fetch: false });
+    await listLocalBranches('/repo', { fetch: true });
+
+    expect(git.checkIsRepo).toHaveBeenCalledTimes(4);
+  });
+});
+
+describe('getLocalBranchSet', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(simpleGit).mockReturnValue(git as never);
+  });
+
+  it('should return the local branch names', async () => {
+    git.branchLocal.mockResolvedValue({ all: ['main', 'bnx-api-0'] });
+
+    expect(await getLocalBranchSet('/repo')).toEqual(new Set(['main', 'bnx-api-0']));
+  });
+
+  it('should return null rather than an empty set when listing fails', async () => {
+    git.branchLocal.mockRejectedValue(new Error('fatal: not a git repository'));
+
+    expect(await getLocalBranchSet('/repo')).toBeNull();
+  });
+});
@@ -1,8 +1,25 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { writeFileSync } from 'node:fs';
 import { DEFAULT_CONFIG } from '../../ts-src/types/config.js';
+import { getConfigPath, loadConfig, saveConfig } from '../../ts-src/core/config.js';
+
+// Point the config store at a throwaway directory instead of the user's config
+vi.mock('conf', async (importOriginal) => {
+  const { mkdtempSync } = await import('node:fs');
+  const { tmpdir } = await import('node:os');
+  const { join } = await import('node:path');
+  const { default: Conf } = await importOriginal<typeof import('conf')>();
+  const cwd = mkdtempSync(join(tmpdir(), 'branchnexus-config-'));
+
+  return {
+    default: class extends Conf<Record<string, unknown>> {
+      constructor(options: ConstructorParameters<typeof Conf>[0]) {
+        super({ ...options, cwd });
+      }
+    },
+  };
+});
 
-// We test the config types and schemas directly since the config module
-// relies on `conf` library which reads/writes files
 describe('config types', () => {
   describe('DEFAULT_CONFIG', () => {
     it('should have all required fields', () => {
@@ -192,3 +209,38 @@ describe('ColorThemeSchema', () => {
     expect(() => ColorThemeSchema.parse('orange')).toThrow();
   });
 });
+
+describe('loadConfig cache', () => {
+  beforeEach(() => {
+    delete process.env.BRANCHNEXUS_GH_TOKEN;
+    saveConfig({ ...DEFAULT_CONFIG });
+  });
+
+  it('should hand out a deep copy on a cache hit', () => {
+    const first = loadConfig();
+    first.commandHooks['post-setup'] = ['echo leaked'];
+    first.defaultPanes = 6;
+
+    const second = loadConfig();
+
+    expect(second.commandHooks).toEqual({});
+    expect(second.defaultPanes).toBe(DEFAULT_CONFIG.defaultPanes);
+  });
+
+  it('should return saved values after saveConfig', () => {
+    loadConfig();
+    saveConfig({ ...DEFAULT_CONFIG, defaultPanes: 3 });
+
+    expect(loadConfig().defaultPanes).toBe(3);
+  });
+
+  it('should pick up an external write that changes the file size', () => {
+    loadConfig();
+    writeFileSync(
+      getConfigPath(),
+      JSON.stringify({ ...DEFAULT_CONFIG, defaultRoot: '/somewhere/else' }, null, '\t')
+    );
+
+    expect(loadConfig().defaultRoot).toBe('/somewhere/else');
+  });
+});
@@ -1,19 +1,31 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { GitHubClient, parseGitHubUrl, checkRepoVisibility } from '../../ts-src/github/api.js';
 
-describe('GitHubClient', () => {
-  const originalFetch = globalThis.fetch;
-  let mockFetch: ReturnType<typeof vi.fn>;
+// One fetch mock installed around every test in this file
+const originalFetch = globalThis.fetch;
+let mockFetch: ReturnType<typeof vi.fn>;
 
-  beforeEach(() => {
-    mockFetch = vi.fn();
-    globalThis.fetch = mockFetch;
-  });
+beforeEach(() => {
+  mockFetch = vi.fn();
+  globalThis.fetch = mockFetch;
+});
 
-  afterEach(() => {
-    globalThis.fetch = originalFetch;
-  });
+afterEach(() => {
+  globalThis.fetch = originalFetch;
+});
+
+interface JsonResponseStub {
+  ok: true;
+  headers: Headers;
+  json: () => Promise<unknown>;
+}
 
+function jsonResponse(body: unknown, link?: string): JsonResponseStub {
+  const headers = new Headers(link !== undefined ? { link } : {});
+  return { ok: true, headers, json: () => Promise.resolve(body) };
+}
+
+describe('GitHubClient', () => {
   describe('constructor', () => {
     it('should accept a token parameter', () => {
       const client = new GitHubClient('test-token');
@@ -37,14 +49,12 @@ describe('GitHubClient', () => {
 
   describe('listRepositories', () => {
     it('should fetch and return repositories', async () => {
-      mockFetch.mockResolvedValue({
-        ok: true,
-        json: () =>
-          Promise.resolve([
-            { full_name: 'user/repo1', clone_url: 'https://github.com/user/repo1.git' },
-            { full_name: 'user/repo2', clone_url: 'https://github.com/user/repo2.git' },
-          ]),
-      });
+      mockFetch.mockResolvedValue(
+        jsonResponse([
+          { full_name: 'user/repo1', clone_url: 'https://github.com/user/repo1.git' },
+          { full_name: 'user/repo2', clone_url: 'https://github.com/user/repo2.git' },
+        ])
+      );
 
       const client = new GitHubClient('test-token');
       const repos = await client.listRepositories();
@@ -69,6 +79,44 @@ describe('GitHubClient', () => {
       );
     });
 
+    it('should follow Link header pagination', async () => {
+      const page2 = 'https://api.github.com/user/repos?per_page=100&sort=updated&page=2';
+      mockFetch
+        .mockResolvedValueOnce(
+          jsonResponse(
+            [{ full_name: 'user/repo1', clone_url: 'https://github.com/user/repo1.git' }],
+            `<${page2}>; rel="next", <${page2}>; rel="last"`
+          )
+        )
+        .mockResolvedValueOnce(
+          jsonResponse([
+            { full_name: 'user/repo2', clone_url: 'https://github.com/user/repo2.git' },
+          ])
+        );
+
+      const client = new GitHubClient('test-token');
+      const repos = await client.listRepositories();
+
+      expect(repos.map((r) => r.fullName)).toEqual(['user/repo1', 'user/repo2']);
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(mockFetch).toHaveBeenLastCalledWith(page2, expect.anything());
+    });
+
+    it('should drop repositories repeated across pages', async () => {
+      const repo1 = { full_name: 'user/repo1', clone_url: 'https://github.com/user/repo1.git' };
+      const repo2 = { full_name: 'user/repo2', clone_url: 'https://github.com/user/repo2.git' };
+      mockFetch
+        .mockResolvedValueOnce(
+          jsonResponse([repo1, repo2], '<https://api.github.com/user/repos?page=2>; rel="next"')
+        )
+        .mockResolvedValueOnce(jsonResponse([repo2]));
+
+      const client = new GitHubClient('test-token');
+      const repos = await client.listRepositories();
+
+      expect(repos.map((r) => r.fullName)).toEqual(['user/repo1', 'user/repo2']);
+    });
+
     it('should throw when no token is available', async () => {
       const prev = process.env.BRANCHNEXUS_GH_TOKEN;
       delete process.env.BRANCHNEXUS_GH_TOKEN;
@@ -97,15 +145,10 @@ describe('GitHubClient', () => {
     it('should fetch and return branches with default flag', async () => {
       // First call: branches list, Second call: repo default branch
       mockFetch
-        .mockResolvedValueOnce({
-          ok: true,
-          json: () =>
-            Promise.resolve([{ name: 'main' }, { name: 'develop' }, { name: 'feature/test' }]),
-        })
-        .mockResolvedValueOnce({
-          ok: true,
-          json: () => Promise.resolve({ default_branch: 'main' }),
-        });
+        .mockResolvedValueOnce(
+          jsonResponse([{ name: 'main' }, { name: 'develop' }, { name: 'feature/test' }])
+        )
+        .mockResolvedValueOnce(jsonResponse({ default_branch: 'main' }));
 
       const client = new GitHubClient('test-token');
       const branches = await client.listBranches('user', 'repo');
@@ -119,10 +162,7 @@ describe('GitHubClient', () => {
 
   describe('getDefaultBranch', () => {
     it('should return the default branch', async () => {
-      mockFetch.mockResolvedValue({
-        ok: true,
-        json: () => Promise.resolve({ default_branch: 'main' }),
-      });
+      mockFetch.mockResolvedValue(jsonResponse({ default_branch: 'main' }));
 
       const client = new GitHubClient('test-token');
       const branch = await client.getDefaultBranch('user', 'repo');
@@ -130,10 +170,7 @@ describe('GitHubClient', () => {
     });
 
     it('should fallback to main when not specified', async () => {
-      mockFetch.mockResolvedValue({
-        ok: true,
-        json: () => Promise.resolve({}),
-      });
+      mockFetch.mockResolvedValue(jsonResponse({}));
 
       const client = new GitHubClient('test-token');
       const branch = await client.getDefaultBranch('user', 'repo');
@@ -183,36 +220,25 @@ describe('parseGitHubUrl', () => {
     expect(parseGitHubUrl('https://bitbucket.org/owner/repo.git')).toBeNull();
     expect(parseGitHubUrl('git@gitlab.com:owner/repo.git')).toBeNull();
   });
-});
 
-describe('checkRepoVisibility', () => {
-  const originalFetch = globalThis.fetch;
-  let mockFetch: ReturnType<typeof vi.fn>;
-
-  beforeEach(() => {
-    mockFetch = vi.fn();
-    globalThis.fetch = mockFetch;
-  });
-
-  afterEach(() => {
-    globalThis.fetch = originalFetch;
+  it('should return the same frozen result for repeated URLs', () => {
+    const first = parseGitHubUrl('https://github.com/owner/cached.git');
+    const second = parseGitHubUrl('https://github.com/owner/cached.git');
+    expect(second).toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
   });
+});
 
+describe('checkRepoVisibility', () => {
   it('should return public for a 200 response with private: false', async () => {
-    mockFetch.mockResolvedValue({
-      ok: true,
-      json: () => Promise.resolve({ private: false }),
-    });
+    mockFetch.mockResolvedValue(jsonResponse({ private: false }));
 
     const result = await checkRepoVisibility('owner', 'repo');
     expect(result).toBe('public');
   });
 
   it('should return private for a 200 response with private: true', async () => {
-    mockFetch.mockResolvedValue({
-      ok: true,
-      json: () => Promise.resolve({ private: true }),
-    });
+    mockFetch.mockResolvedValue(jsonResponse({ private: true }));
 
     const result = await checkRepoVisibility('owner', 'repo', 'token');
     expect(result).toBe('private');
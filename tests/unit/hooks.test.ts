@@ -1,4 +1,5 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { execa } from 'execa';
 import { HookRunner } from '../../ts-src/hooks/runner.js';
 
 // Mock execa
@@ -27,6 +28,12 @@ vi.mock('../../ts-src/utils/logger.js', () => ({
   },
 }));
 
+const mockExeca = vi.mocked(execa);
+
+function execaResult(exitCode: number, stdout: string, stderr: string) {
+  return { exitCode, stdout, stderr } as never;
+}
+
 describe('HookRunner', () => {
   beforeEach(() => {
     vi.clearAllMocks();
@@ -50,13 +57,7 @@ describe('HookRunner', () => {
 
   describe('run', () => {
     it('should execute commands and return results', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
-      mockExeca.mockResolvedValue({
-        exitCode: 0,
-        stdout: 'success',
-        stderr: '',
-      } as never);
+      mockExeca.mockResolvedValue(execaResult(0, 'success', ''));
 
       const runner = new HookRunner();
       const result = await runner.run(0, ['echo hello']);
@@ -69,13 +70,7 @@ describe('HookRunner', () => {
     });
 
     it('should handle failed commands', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
-      mockExeca.mockResolvedValue({
-        exitCode: 1,
-        stdout: '',
-        stderr: 'error output',
-      } as never);
+      mockExeca.mockResolvedValue(execaResult(1, '', 'error output'));
 
       const runner = new HookRunner();
       const result = await runner.run(1, ['failing-cmd']);
@@ -87,11 +82,9 @@ describe('HookRunner', () => {
     });
 
     it('should handle multiple commands', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
       mockExeca
-        .mockResolvedValueOnce({ exitCode: 0, stdout: 'ok', stderr: '' } as never)
-        .mockResolvedValueOnce({ exitCode: 1, stdout: '', stderr: 'fail' } as never);
+        .mockResolvedValueOnce(execaResult(0, 'ok', ''))
+        .mockResolvedValueOnce(execaResult(1, '', 'fail'));
 
       const runner = new HookRunner();
       const result = await runner.run(0, ['cmd1', 'cmd2']);
@@ -125,13 +118,7 @@ describe('HookRunner', () => {
     });
 
     it('should allow commands matching allowlist prefix', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
-      mockExeca.mockResolvedValue({
-        exitCode: 0,
-        stdout: 'installed',
-        stderr: '',
-      } as never);
+      mockExeca.mockResolvedValue(execaResult(0, 'installed', ''));
 
       const runner = new HookRunner({
         trustedConfig: false,
@@ -144,8 +131,6 @@ describe('HookRunner', () => {
     });
 
     it('should handle timeout errors', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
       mockExeca.mockRejectedValue(new Error('timed out after 30000'));
 
       const runner = new HookRunner({ timeoutSeconds: 1 });
@@ -157,8 +142,6 @@ describe('HookRunner', () => {
     });
 
     it('should handle non-timeout errors', async () => {
-      const { execa } = await import('execa');
-      const mockExeca = vi.mocked(execa);
       mockExeca.mockRejectedValue(new Error('command not found'));
 
       const runner = new HookRunner();
@@ -1,5 +1,9 @@
 import { describe, it, expect } from 'vitest';
-import { buildLayoutCommands, validateLayout } from '../../ts-src/tmux/layouts.js';
+import {
+  buildLayoutCommands,
+  chainTmuxCommands,
+  validateLayout,
+} from '../../ts-src/tmux/layouts.js';
 import { BranchNexusError, ExitCode } from '../../ts-src/types/errors.js';
 
 describe('layouts', () => {
@@ -66,4 +70,40 @@ describe('layouts', () => {
       expect(commands.some((cmd) => cmd.includes('select-layout'))).toBe(true);
     });
   });
+
+  describe('chainTmuxCommands', () => {
+    it('should fold consecutive tmux commands into one invocation', () => {
+      const chained = chainTmuxCommands([
+        ['tmux', 'set-option', '-t', 's', 'mouse', 'on'],
+        ['tmux', 'select-pane', '-t', 's:0.0'],
+      ]);
+
+      expect(chained).toEqual([
+        ['tmux', 'set-option', '-t', 's', 'mouse', 'on', ';', 'select-pane', '-t', 's:0.0'],
+      ]);
+    });
+
+    it('should escape arguments ending with a semicolon', () => {
+      const chained = chainTmuxCommands([
+        ['tmux', 'send-keys', '-t', 's:0.0', 'make;', 'Enter'],
+        ['tmux', 'select-pane', '-t', 's:0.0'],
+      ]);
+
+      expect(chained[0]).toContain('make\\;');
+    });
+
+    it('should keep non-tmux commands separate', () => {
+      const chained = chainTmuxCommands([
+        ['tmux', 'select-pane', '-t', 's:0.0'],
+        ['echo', 'hi'],
+        ['tmux', 'select-pane', '-t', 's:0.1'],
+      ]);
+
+      expect(chained).toHaveLength(3);
+    });
+
+    it('should return an empty list for no commands', () => {
+      expect(chainTmuxCommands([])).toEqual([]);
+    });
+  });
 });
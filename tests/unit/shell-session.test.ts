@@ -0,0 +1,107 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { spawn, type ChildProcess } from 'node:child_process';
+import { WslShellSession } from '../../ts-src/runtime/shell.js';
+
+// Replace the wsl.exe argv with a local bash so the session protocol runs for real
+vi.mock('node:child_process', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('node:child_process')>();
+  return {
+    ...actual,
+    spawn: vi.fn((_command: string, _args: string[], options: object) =>
+      actual.spawn('bash', ['--noprofile', '--norc'], options)
+    ),
+  };
+});
+
+// Mock logger
+vi.mock('../../ts-src/utils/logger.js', () => ({
+  logger: { debug: vi.fn(), info: vi.fn(), warn: vi.fn(), error: vi.fn() },
+}));
+
+const lastChild = (): ChildProcess => vi.mocked(spawn).mock.results.at(-1)?.value as ChildProcess;
+
+describe('WslShellSession', () => {
+  let session: WslShellSession;
+
+  afterEach(() => {
+    session.close();
+    vi.mocked(spawn).mockClear();
+  });
+
+  it('should report exit codes', async () => {
+    session = new WslShellSession('Ubuntu');
+
+    expect((await session.run(['true'])).exitCode).toBe(0);
+    expect((await session.run(['sh', '-c', 'exit 3'])).exitCode).toBe(3);
+    expect(spawn).toHaveBeenCalledTimes(1);
+  });
+
+  it('should return empty output and output without a final newline', async () => {
+    session = new WslShellSession('Ubuntu');
+
+    expect(await session.run(['true'])).toEqual({ exitCode: 0, stdout: '', stderr: '' });
+    expect((await session.run(['printf', 'abc'])).stdout).toBe('abc');
+    expect((await session.run(['printf', 'a\nb\n'])).stdout).toBe('a\nb');
+  });
+
+  it('should split stdout and stderr', async () => {
+    session = new WslShellSession('Ubuntu');
+
+    const result = await session.run(['sh', '-c', 'echo out; echo err >&2; exit 2']);
+
+    expect(result).toEqual({ exitCode: 2, stdout: 'out', stderr: 'err' });
+  });
+
+  it('should not attribute start-up stderr to the first command', async () => {
+    const spawnShell = vi.mocked(spawn).getMockImplementation()!;
+    vi.mocked(spawn).mockImplementationOnce((command, args, options) => {
+      const child = spawnShell(command, args, options);
+      child.stdin?.write('echo startup-noise >&2\n');
+      return child;
+    });
+    session = new WslShellSession('Ubuntu');
+
+    expect(await session.run(['echo', 'ok'])).toEqual({ exitCode: 0, stdout: 'ok', stderr: '' });
+  });
+
+  it('should time out and start a fresh shell on the next run', async () => {
+    session = new WslShellSession('Ubuntu');
+
+    const timedOut = await session.run(['sh', '-c', 'sleep 0.3; echo stale'], { timeout: 100 });
+    expect(timedOut.exitCode).toBe(124);
+
+    expect((await session.run(['echo', 'ok'])).stdout).toBe('ok');
+    await new Promise((resolve) => setTimeout(resolve, 400));
+    expect((await session.run(['echo', 'again'])).stdout).toBe('again');
+    expect(spawn).toHaveBeenCalledTimes(2);
+  });
+
+  it('should fail the pending command when the shell exits', async () => {
+    session = new WslShellSession('Ubuntu');
+    await session.run(['true']);
+
+    const pending = session.run(['sleep', '5']);
+    await new Promise((resolve) => setTimeout(resolve, 100));
+    lastChild().kill('SIGKILL');
+    const result = await pending;
+
+    expect(result.exitCode).toBe(1);
+    expect(result.stderr).toContain('exited');
+    expect((await session.run(['echo', 'ok'])).stdout).toBe('ok');
+  });
+
+  it('should fail the pending command when the session is closed', async () => {
+    session = new WslShellSession('Ubuntu');
+    await session.run(['true']);
+
+    const pending = session.run(['sleep', '5']);
+    await new Promise((resolve) => setTimeout(resolve, 100));
+    session.close();
+
+    expect(await pending).toEqual({
+      exitCode: 1,
+      stdout: '',
+      stderr: 'WSL shell session closed',
+    });
+  });
+});
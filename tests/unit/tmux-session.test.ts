@@ -0,0 +1,65 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { wrapTmuxCommand } from '../../ts-src/tmux/session.js';
+import { chainTmuxCommands } from '../../ts-src/tmux/layouts.js';
+import { detectPlatform } from '../../ts-src/runtime/platform.js';
+
+// Mock platform detection
+vi.mock('../../ts-src/runtime/platform.js', () => ({
+  Platform: { WINDOWS: 'windows', MACOS: 'macos', LINUX: 'linux' },
+  detectPlatform: vi.fn(() => 'linux'),
+}));
+
+// Mock command execution; only argv construction is under test
+vi.mock('../../ts-src/runtime/shell.js', () => ({
+  runCommand: vi.fn(),
+  runCommandViaWSL: vi.fn(),
+}));
+
+describe('wrapTmuxCommand', () => {
+  const chained = chainTmuxCommands([
+    ['tmux', 'bind-key', '-n', 'M-1', 'select-pane', '-t', 's:0.0'],
+    ['tmux', 'select-pane', '-t', 's:0.0'],
+  ])[0];
+
+  beforeEach(() => {
+    vi.mocked(detectPlatform).mockReturnValue('linux' as never);
+  });
+
+  it('should run a chained command via wsl.exe --exec on Windows', () => {
+    vi.mocked(detectPlatform).mockReturnValue('windows' as never);
+
+    expect(wrapTmuxCommand(chained, 'Ubuntu')).toEqual([
+      'wsl.exe',
+      '-d',
+      'Ubuntu',
+      '--exec',
+      'tmux',
+      'bind-key',
+      '-n',
+      'M-1',
+      'select-pane',
+      '-t',
+      's:0.0',
+      ';',
+      'select-pane',
+      '-t',
+      's:0.0',
+    ]);
+  });
+
+  it('should never hand a chained command to the WSL default shell', () => {
+    vi.mocked(detectPlatform).mockReturnValue('windows' as never);
+
+    expect(wrapTmuxCommand(chained, 'Ubuntu')).not.toContain('--');
+  });
+
+  it('should leave the command unwrapped on native platforms', () => {
+    expect(wrapTmuxCommand(chained, 'Ubuntu')).toBe(chained);
+  });
+
+  it('should leave the command unwrapped on Windows without a distribution', () => {
+    vi.mocked(detectPlatform).mockReturnValue('windows' as never);
+
+    expect(wrapTmuxCommand(chained)).toBe(chained);
+  });
+});
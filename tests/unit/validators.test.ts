@@ -457,6 +457,12 @@ describe('validators', () => {
     it('should handle mixed valid and invalid characters', () => {
       expect(sanitizePathSegment('feat/my-branch_v2.0!!')).toBe('feat-my-branch_v2.0');
     });
+
+    it('should handle long hyphen runs without backtracking', () => {
+      const hyphens = '-'.repeat(100_000);
+      expect(sanitizePathSegment(`!${hyphens}!b`)).toBe('b');
+      expect(sanitizePathSegment(`a${hyphens}!`)).toBe('a');
+    });
   });
 
   describe('normalizePath', () => {
@@ -4,7 +4,27 @@ import {
   type ManagedWorktree,
   createWorktreeAssignment,
   createManagedWorktree,
+  sortByPane,
 } from '../../ts-src/types/worktree.js';
+import { parseWorktreeList, WorktreeManager } from '../../ts-src/git/worktree.js';
+import { runCommand } from '../../ts-src/runtime/shell.js';
+
+// Mock command execution; git calls are answered per argv
+vi.mock('../../ts-src/runtime/shell.js', () => ({
+  runCommand: vi.fn(),
+  runCommandViaWSL: vi.fn(),
+  WslShellSession: vi.fn(),
+}));
+
+// Mock logger
+vi.mock('../../ts-src/utils/logger.js', () => ({
+  logger: {
+    debug: vi.fn(),
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+  },
+}));
 
 describe('worktree types', () => {
   describe('createWorktreeAssignment', () => {
@@ -58,6 +78,108 @@ describe('worktree types', () => {
   });
 });
 
+describe('sortByPane', () => {
+  it('should return already ordered input unchanged', () => {
+    const items = [
+      createWorktreeAssignment(0, '/repo', 'a'),
+      createWorktreeAssignment(1, '/repo', 'b'),
+    ];
+    expect(sortByPane(items)).toBe(items);
+    expect(items.map((a) => a.pane)).toEqual([0, 1]);
+  });
+
+  it('should sort out-of-order input by pane', () => {
+    const items = [
+      createWorktreeAssignment(2, '/repo', 'c'),
+      createWorktreeAssignment(0, '/repo', 'a'),
+      createWorktreeAssignment(1, '/repo', 'b'),
+    ];
+    expect(sortByPane(items).map((a) => a.branch)).toEqual(['a', 'b', 'c']);
+  });
+});
+
+describe('parseWorktreeList', () => {
+  it('should collect paths and branch refs in one pass', () => {
+    const output = [
+      'worktree /repo',
+      'HEAD abc123',
+      'branch refs/heads/main',
+      '',
+      'worktree /wt/repo/feature',
+      'HEAD def456',
+      'branch refs/heads/feature',
+      '',
+      'worktree /wt/repo/detached',
+      'HEAD 789abc',
+      'detached',
+      '',
+    ].join('\n');
+
+    const listing = parseWorktreeList(output);
+
+    expect([...listing.paths]).toEqual(['/repo', '/wt/repo/feature', '/wt/repo/detached']);
+    expect(listing.byBranch.get('refs/heads/main')).toEqual(['/repo']);
+    expect(listing.byBranch.get('refs/heads/feature')).toEqual(['/wt/repo/feature']);
+    expect(listing.byBranch.size).toBe(2);
+  });
+
+  it('should return empty collections for empty output', () => {
+    const listing = parseWorktreeList('');
+    expect(listing.paths.size).toBe(0);
+    expect(listing.byBranch.size).toBe(0);
+  });
+});
+
+describe('WorktreeManager.materialize', () => {
+  beforeEach(() => {
+    vi.mocked(runCommand).mockReset();
+  });
+
+  it('should roll back worktrees from other repos when one repo fails', async () => {
+    vi.mocked(runCommand).mockImplementation(async (cmd: string[]) => {
+      if (cmd[2] === '/repo-b' && cmd[4] === 'add') {
+        return { exitCode: 128, stdout: '', stderr: 'fatal: invalid reference: missing' };
+      }
+      return { exitCode: 0, stdout: '', stderr: '' };
+    });
+
+    const manager = new WorktreeManager('/wt');
+    await expect(
+      manager.materialize([
+        createWorktreeAssignment(0, '/repo-a', 'main'),
+        createWorktreeAssignment(1, '/repo-b', 'missing'),
+      ])
+    ).rejects.toMatchObject({
+      message: 'Failed to create worktree for pane 1',
+      hint: 'fatal: invalid reference: missing',
+    });
+
+    expect(runCommand).toHaveBeenCalledWith([
+      'git',
+      '-C',
+      '/repo-a',
+      'worktree',
+      'remove',
+      '--force',
+      '/wt/repo-a/main',
+    ]);
+  });
+
+  it('should not run a rollback when every repo succeeds', async () => {
+    vi.mocked(runCommand).mockResolvedValue({ exitCode: 0, stdout: '', stderr: '' });
+
+    const manager = new WorktreeManager('/wt');
+    const created = await manager.materialize([
+      createWorktreeAssignment(1, '/repo-b', 'dev'),
+      createWorktreeAssignment(0, '/repo-a', 'main'),
+    ]);
+
+    expect(created.map((w) => w.pane)).toEqual([0, 1]);
+    const removals = vi.mocked(runCommand).mock.calls.filter(([cmd]) => cmd[4] === 'remove');
+    expect(removals).toHaveLength(0);
+  });
+});
+
 describe('session types', () => {
   let createTerminalSnapshot: typeof import('../../ts-src/types/session.js').createTerminalSnapshot;
   let createSessionSnapshot: typeof import('../../ts-src/types/session.js').createSessionSnapshot;
@@ -1,19 +1,12 @@
 #!/usr/bin/env node
 import { Command } from 'commander';
 import chalk from 'chalk';
-import {
-  initCommand,
-  runCommand,
-  configCommand,
-  killCommand,
-  presetCommand,
-  statusCommand,
-  attachCommand,
-} from './commands/index.js';
 import { type RunOptions } from './commands/run.js';
 import { userFacingError, isBranchNexusError, ExitCode } from './types/errors.js';
 import { configureLogging, defaultLogPath, logger } from './utils/logger.js';
 
+// Command modules are imported on demand so each invocation only loads the
+// subcommand it runs (and that subcommand's prompt/git/tmux dependencies)
 const program = new Command();
 
 program
@@ -25,6 +18,7 @@ program
   .command('init')
   .description('First-time setup wizard')
   .action(async () => {
+    const { initCommand } = await import('./prompts/setup.js');
     await initCommand();
   });
 
@@ -34,15 +28,19 @@ program
   .argument('[action]', 'show | set | reset | export | import')
   .argument('[key]', 'Config key or file path')
   .argument('[value]', 'Config value')
-  .action((action: string | undefined, key: string | undefined, value: string | undefined) => {
-    configCommand(action, key, value);
-  });
+  .action(
+    async (action: string | undefined, key: string | undefined, value: string | undefined) => {
+      const { configCommand } = await import('./commands/config.js');
+      configCommand(action, key, value);
+    }
+  );
 
 program
   .command('kill')
   .description('Kill an active BranchNexus tmux session')
   .argument('[session]', 'Session name to kill')
   .action(async (session?: string) => {
+    const { killCommand } = await import('./commands/kill.js');
     await killCommand(session);
   });
 
@@ -52,7 +50,8 @@ program
   .argument('[action]', 'list | save | load | delete | rename')
   .argument('[name]', 'Preset name')
   .argument('[extra]', 'JSON data or new name for rename')
-  .action((action?: string, name?: string, extra?: string) => {
+  .action(async (action?: string, name?: string, extra?: string) => {
+    const { presetCommand } = await import('./commands/preset.js');
     presetCommand(action, name, extra);
   });
 
@@ -60,6 +59,7 @@ program
   .command('status')
   .description('Show BranchNexus status overview')
   .action(async () => {
+    const { statusCommand } = await import('./commands/status.js');
     await statusCommand();
   });
 
@@ -68,6 +68,7 @@ program
   .description('Attach to a detached BranchNexus tmux session')
   .argument('[session]', 'Session name to attach')
   .action(async (session?: string) => {
+    const { attachCommand } = await import('./commands/attach.js');
     await attachCommand(session);
   });
 
@@ -85,6 +86,7 @@ program
   .option('--no-hooks', 'Skip command hooks');
 
 program.action(async (options: Record<string, unknown>) => {
+  const { runCommand } = await import('./commands/run.js');
   await runCommand(options as RunOptions);
 });
 
@@ -1,22 +1,31 @@
 import chalk from 'chalk';
 import * as p from '@clack/prompts';
-import { existsSync, readdirSync } from 'node:fs';
+import { existsSync, readdirSync, rmdirSync, type Dirent } from 'node:fs';
 import { join } from 'node:path';
 import { listSessions, killSession } from '../tmux/session.js';
 import { loadConfig } from '../core/config.js';
+import { type AppConfig } from '../types/index.js';
 import { expandHomeDir } from '../runtime/platform.js';
-import { runCommand } from '../runtime/shell.js';
+import { runCommand, WslShellSession, type ShellResult } from '../runtime/shell.js';
+import { hasDistribution } from '../utils/validators.js';
 import { logger } from '../utils/logger.js';
 
 const SESSION_PREFIX = 'branch-nexus';
+// Main worktree is the first "worktree" entry of `git worktree list --porcelain`
+const MAIN_WORKTREE_RE = /^worktree (.+)$/m;
 
-async function cleanupWorktreeDir(basePath: string, distribution?: string): Promise<number> {
-  if (!existsSync(basePath)) {
+type CommandRunner = (command: string[]) => Promise<ShellResult>;
+
+async function cleanupWorktreeDir(basePath: string, run: CommandRunner): Promise<number> {
+  // Read directly instead of probing with existsSync first; a missing base means nothing to clean
+  let repoDirs: Dirent[];
+  try {
+    repoDirs = readdirSync(basePath, { withFileTypes: true }).filter((d) => d.isDirectory());
+  } catch {
     return 0;
   }
 
   let removed = 0;
-  const repoDirs = readdirSync(basePath, { withFileTypes: true }).filter((d) => d.isDirectory());
 
   for (const repoDir of repoDirs) {
     const repoWorktreeDir = join(basePath, repoDir.name);
@@ -36,24 +45,13 @@ async function cleanupWorktreeDir(basePath: string, distribution?: string): Prom
       // Find the parent repo to run git worktree remove against it
       const cmd = ['git', '-C', panePath, 'worktree', 'list', '--porcelain'];
       try {
-        const result = distribution
-          ? await runCommand(['wsl', '-d', distribution, ...cmd])
-          : await runCommand(cmd);
-
-        // Extract the main worktree path (first "worktree" entry)
-        let mainRepoPath = '';
-        for (const line of result.stdout.split('\n')) {
-          if (line.startsWith('worktree ')) {
-            mainRepoPath = line.slice(9).trim();
-            break;
-          }
-        }
+        const result = await run(cmd);
+
+        const mainRepoPath = MAIN_WORKTREE_RE.exec(result.stdout)?.[1].trim() ?? '';
 
         if (mainRepoPath !== '') {
           const removeCmd = ['git', '-C', mainRepoPath, 'worktree', 'remove', '--force', panePath];
-          const removeResult = distribution
-            ? await runCommand(['wsl', '-d', distribution, ...removeCmd])
-            : await runCommand(removeCmd);
+          const removeResult = await run(removeCmd);
 
           if (removeResult.exitCode === 0) {
             removed++;
@@ -69,14 +67,10 @@ async function cleanupWorktreeDir(basePath: string, distribution?: string): Prom
       }
     }
 
-    // Remove the repo directory if now empty
+    // Remove the repo directory if now empty; rmdir fails with ENOTEMPTY otherwise
     try {
-      const remaining = readdirSync(repoWorktreeDir);
-      if (remaining.length === 0) {
-        const { rmSync } = await import('node:fs');
-        rmSync(repoWorktreeDir, { recursive: true });
-        logger.debug(`Removed empty worktree dir: ${repoWorktreeDir}`);
-      }
+      rmdirSync(repoWorktreeDir);
+      logger.debug(`Removed empty worktree dir: ${repoWorktreeDir}`);
     } catch {
       // ignore
     }
@@ -84,12 +78,8 @@ async function cleanupWorktreeDir(basePath: string, distribution?: string): Prom
 
   // Remove basePath if now empty
   try {
-    const remaining = readdirSync(basePath);
-    if (remaining.length === 0) {
-      const { rmSync } = await import('node:fs');
-      rmSync(basePath, { recursive: true });
-      logger.debug(`Removed empty worktree base: ${basePath}`);
-    }
+    rmdirSync(basePath);
+    logger.debug(`Removed empty worktree base: ${basePath}`);
   } catch {
     // ignore
   }
@@ -97,26 +87,32 @@ async function cleanupWorktreeDir(basePath: string, distribution?: string): Prom
   return removed;
 }
 
-async function cleanupWorktrees(distribution?: string): Promise<number> {
-  const config = loadConfig();
+async function cleanupWorktrees(config: AppConfig, distribution?: string): Promise<number> {
   const root = config.defaultRoot !== '' ? config.defaultRoot : expandHomeDir('~');
   const workspaceRoot =
     config.defaultRoot !== '' ? config.defaultRoot : expandHomeDir('~/workspace');
 
   // Clean both new (.bnx) and legacy (branchnexus-worktrees) paths
-  const paths = [
+  // Built as a Set so a shared root and workspace root collapse to one entry each
+  const paths = new Set([
     join(root, '.bnx'),
     join(workspaceRoot, '.bnx'),
     join(workspaceRoot, 'branchnexus-worktrees'),
     join(root, 'branchnexus-worktrees'),
-  ];
+  ]);
+
+  // One WSL shell serves every list/remove call instead of a wsl spawn per command
+  const session = hasDistribution(distribution) ? new WslShellSession(distribution) : null;
+  const run: CommandRunner =
+    session !== null ? (cmd) => session.run(cmd) : (cmd) => runCommand(cmd);
 
   let total = 0;
-  const seen = new Set<string>();
-  for (const p of paths) {
-    if (seen.has(p)) continue;
-    seen.add(p);
-    total += await cleanupWorktreeDir(p, distribution);
+  try {
+    for (const p of paths) {
+      total += await cleanupWorktreeDir(p, run);
+    }
+  } finally {
+    session?.close();
   }
   return total;
 }
@@ -132,7 +128,7 @@ export async function killCommand(sessionName?: string): Promise<void> {
     console.log(chalk.yellow('\nAktif BranchNexus session bulunamadı.\n'));
 
     // Still try to clean up orphaned worktrees
-    const removed = await cleanupWorktrees(distribution);
+    const removed = await cleanupWorktrees(config, distribution);
     if (removed > 0) {
       console.log(chalk.green(`${removed} orphan worktree temizlendi.\n`));
     }
@@ -173,7 +169,7 @@ export async function killCommand(sessionName?: string): Promise<void> {
   console.log(chalk.green(`\n✓ Session "${target}" kapatıldı.`));
 
   // 2) Cleanup worktrees
-  const removed = await cleanupWorktrees(distribution);
+  const removed = await cleanupWorktrees(config, distribution);
   if (removed > 0) {
     console.log(chalk.green(`✓ ${removed} worktree temizlendi.\n`));
   } else {
@@ -1,6 +1,6 @@
 import chalk from 'chalk';
 import * as p from '@clack/prompts';
-import { type Layout, type CleanupPolicy } from '../types/index.js';
+import { type Layout, type CleanupPolicy, type WorktreeAssignment } from '../types/index.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { loadConfig, updateLastSession } from '../core/config.js';
 import { orchestrate, type OrchestrationRequest } from '../core/orchestrator.js';
@@ -14,7 +14,13 @@ import {
   confirmStart,
 } from '../prompts/panel.js';
 import { promptCleanup } from '../prompts/cleanup.js';
-import { Platform, detectPlatform, expandHomeDir, hasTmux } from '../runtime/platform.js';
+import {
+  Platform,
+  detectPlatform,
+  expandHomeDir,
+  getTmuxInstallCommand,
+  hasTmux,
+} from '../runtime/platform.js';
 import { listDistributions } from '../runtime/wsl.js';
 import { logger, configureLogging } from '../utils/logger.js';
 import { cloneRepository, checkRepositoryAccess } from '../git/clone.js';
@@ -26,6 +32,8 @@ import { HookRunner } from '../hooks/runner.js';
 import { parseRuntimeSnapshot, SessionCleanupHandler } from '../core/session.js';
 import { WorktreeManager } from '../git/worktree.js';
 
+const GIT_AUTH_FAILURE_RE = /403|Authentication failed/i;
+
 export interface RunOptions {
   root?: string;
   layout?: Layout;
@@ -67,32 +75,14 @@ async function ensureTmuxInstalled(): Promise<void> {
   }
 
   // Linux/WSL
-  let installCmd: string;
-
-  try {
-    await execa('which', ['apt-get']);
-    installCmd = 'apt-get update && apt-get install -y tmux';
-  } catch {
-    try {
-      await execa('which', ['dnf']);
-      installCmd = 'dnf install -y tmux';
-    } catch {
-      try {
-        await execa('which', ['pacman']);
-        installCmd = 'pacman -S --noconfirm tmux';
-      } catch {
-        try {
-          await execa('which', ['apk']);
-          installCmd = 'apk add tmux';
-        } catch {
-          throw new BranchNexusError(
-            'Paket yöneticisi bulunamadı.',
-            ExitCode.TMUX_ERROR,
-            "Lütfen tmux'u manuel kurun."
-          );
-        }
-      }
-    }
+  const installCmd = await getTmuxInstallCommand();
+
+  if (installCmd === null) {
+    throw new BranchNexusError(
+      'Paket yöneticisi bulunamadı.',
+      ExitCode.TMUX_ERROR,
+      "Lütfen tmux'u manuel kurun."
+    );
   }
 
   // Try sudo -n first (no password needed)
@@ -174,11 +164,14 @@ export async function runCommand(options: RunOptions): Promise<void> {
         }
 
         // Rebuild from snapshot
-        const assignments = snapshot.terminals.map((t, i) => ({
-          pane: i,
-          repoPath: t.repoPath,
-          branch: t.branch,
-        }));
+        const assignments: WorktreeAssignment[] = [];
+        const paneNames: string[] = [];
+        const displayBranches: string[] = [];
+        snapshot.terminals.forEach((t, i) => {
+          assignments.push({ pane: i, repoPath: t.repoPath, branch: t.branch });
+          paneNames.push(t.title);
+          displayBranches.push(t.branch);
+        });
 
         const worktreeBase = expandHomeDir(
           config.defaultRoot !== '' ? `${config.defaultRoot}/.bnx` : '~/.bnx'
@@ -194,8 +187,8 @@ export async function runCommand(options: RunOptions): Promise<void> {
           sessionName,
           tmuxAutoInstall: config.tmuxAutoInstall,
           colorTheme: config.colorTheme,
-          paneNames: snapshot.terminals.map((t) => t.title),
-          displayBranches: snapshot.terminals.map((t) => t.branch),
+          paneNames,
+          displayBranches,
         };
 
         const s = p.spinner();
@@ -269,13 +262,14 @@ export async function runCommand(options: RunOptions): Promise<void> {
   const workspaceRoot = expandHomeDir(
     config.defaultRoot !== '' ? config.defaultRoot : '~/workspace'
   );
-  if (!existsSync(workspaceRoot)) {
-    mkdirSync(workspaceRoot, { recursive: true });
-  }
+  // recursive mkdir is a no-op for an existing directory, so no existsSync probe is needed
+  mkdirSync(workspaceRoot, { recursive: true });
 
   // Clone/fetch all repos
   const s = p.spinner();
   const localRepoPaths: string[] = [];
+  // Repos cloned or fetched above don't need another fetch when listing branches
+  const freshRepoPaths = new Set<string>();
 
   for (const url of allRepoUrls) {
     let rName = basename(url.replace('.git', ''));
@@ -286,11 +280,13 @@ export async function runCommand(options: RunOptions): Promise<void> {
     const localPath = join(workspaceRoot, rName);
     localRepoPaths.push(localPath);
 
-    if (existsSync(localPath) && existsSync(join(localPath, '.git'))) {
+    // A present .git implies the repo directory exists; one stat covers both
+    if (existsSync(join(localPath, '.git'))) {
       s.start(`Mevcut repo kullanılıyor: ${rName}...`);
       try {
         const git = simpleGit(localPath);
-        await git.fetch('origin');
+        await git.fetch(['--all']);
+        freshRepoPaths.add(localPath);
         s.stop('Mevcut repo: ' + localPath);
       } catch {
         s.stop('Fetch başarısız, local ile devam');
@@ -311,12 +307,13 @@ export async function runCommand(options: RunOptions): Promise<void> {
 
       try {
         await cloneRepository(url, localPath, token ?? undefined);
+        freshRepoPaths.add(localPath);
         s.stop('Klonlandı: ' + localPath);
       } catch (error) {
         s.stop('Klonlama başarısız');
         const message = error instanceof Error ? error.message : String(error);
 
-        if (message.includes('403') || message.includes('Authentication failed')) {
+        if (GIT_AUTH_FAILURE_RE.test(message)) {
           showError('Kimlik doğrulama başarısız', 'Private repo için GitHub token gerekli');
           return;
         }
@@ -338,7 +335,7 @@ export async function runCommand(options: RunOptions): Promise<void> {
 
     for (let ri = 0; ri < localRepoPaths.length; ri++) {
       const rPath = localRepoPaths[ri];
-      const branchResult = await listLocalBranches(rPath);
+      const branchResult = await listLocalBranches(rPath, { fetch: !freshRepoPaths.has(rPath) });
 
       if (branchResult.warning !== undefined && branchResult.warning !== '') {
         p.log.warn(branchResult.warning);
@@ -401,6 +398,8 @@ export async function runCommand(options: RunOptions): Promise<void> {
   // Create a unique local branch per pane: e.g. bnx-Alpha-0, bnx-Beta-1
   const resolvedBranches: string[] = [];
   const paneRepoPaths: string[] = [];
+  const localBranchesByRepo = new Map<string, Set<string> | null>();
+  const { getLocalBranchSet } = await import('../git/branch.js');
 
   for (let i = 0; i < branches.length; i++) {
     const branchKey = branches[i];
@@ -413,14 +412,24 @@ export async function runCommand(options: RunOptions): Promise<void> {
     const safeName =
       paneNames[i].replace(/[^A-Za-z0-9._-]+/g, '-').replace(/^-+|-+$/g, '') || `pane-${i}`;
     const localName = `bnx-${safeName}-${i}`;
+
+    if (!localBranchesByRepo.has(paneRepoPath)) {
+      localBranchesByRepo.set(paneRepoPath, await getLocalBranchSet(paneRepoPath));
+    }
+    const knownBranches = localBranchesByRepo.get(paneRepoPath) ?? null;
+
     try {
-      // Delete if exists from previous run, then recreate from source
-      try {
-        await git.branch(['-D', localName]);
-      } catch {
-        /* ignore */
+      // Delete if exists from previous run (always attempted when the listing failed),
+      // then recreate from source
+      if (knownBranches === null || knownBranches.has(localName)) {
+        try {
+          await git.branch(['-D', localName]);
+        } catch {
+          /* ignore */
+        }
       }
       await git.branch([localName, actualBranch]);
+      knownBranches?.add(localName);
       logger.debug(`Created local branch ${localName} from ${actualBranch}`);
     } catch {
       logger.debug(`Branch ${localName} already exists, reusing`);
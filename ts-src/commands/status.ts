@@ -2,7 +2,7 @@ import chalk from 'chalk';
 import { loadConfig, getConfigPath } from '../core/config.js';
 import { loadPresets } from '../core/presets.js';
 import { listSessions } from '../tmux/session.js';
-import { existsSync, readdirSync } from 'node:fs';
+import { existsSync, readdirSync, type Dirent } from 'node:fs';
 import { join } from 'node:path';
 import { expandHomeDir } from '../runtime/platform.js';
 
@@ -35,9 +35,19 @@ export async function statusCommand(): Promise<void> {
   const root = config.defaultRoot !== '' ? config.defaultRoot : expandHomeDir('~');
   const bnxDir = join(root, '.bnx');
 
-  if (existsSync(bnxDir)) {
+  // Read directly instead of probing with existsSync first; a missing .bnx means no worktrees
+  let repoDirs: Dirent[] = [];
+  let unreadable = false;
+  try {
+    repoDirs = readdirSync(bnxDir, { withFileTypes: true }).filter((d) => d.isDirectory());
+  } catch (error) {
+    unreadable = (error as NodeJS.ErrnoException).code !== 'ENOENT';
+  }
+
+  if (unreadable) {
+    console.log(chalk.dim('  Worktree dizini okunamadı'));
+  } else if (repoDirs.length > 0) {
     try {
-      const repoDirs = readdirSync(bnxDir, { withFileTypes: true }).filter((d) => d.isDirectory());
       let wtCount = 0;
 
       for (const repoDir of repoDirs) {
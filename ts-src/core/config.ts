@@ -1,17 +1,22 @@
+import { statSync } from 'node:fs';
 import { z } from 'zod';
 import Conf from 'conf';
 import {
   type AppConfig,
   DEFAULT_CONFIG,
   AppConfigSchema,
-  type CleanupPolicy,
+  CleanupPolicySchema,
+  ColorThemeSchema,
+  LayoutSchema,
   type ColorTheme,
-  type Layout,
 } from '../types/index.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
+import { isValidCleanupPolicy, isValidLayout } from '../utils/validators.js';
 
 const GITHUB_TOKEN_ENV = 'BRANCHNEXUS_GH_TOKEN';
 
+const COLOR_THEME_VALUES: ReadonlySet<string> = new Set(ColorThemeSchema.options);
+
 const configStore = new Conf<AppConfig>({
   projectName: 'branch-nexus',
   configName: 'config',
@@ -22,16 +27,16 @@ const configStore = new Conf<AppConfig>({
     githubToken: { type: 'string' },
     githubRepositoriesCache: { type: 'array' },
     githubBranchesCache: { type: 'object' },
-    defaultLayout: { type: 'string', enum: ['horizontal', 'vertical', 'grid'] },
+    defaultLayout: { type: 'string', enum: [...LayoutSchema.options] },
     defaultPanes: { type: 'number', minimum: 2, maximum: 6 },
-    cleanupPolicy: { type: 'string', enum: ['session', 'persistent'] },
+    cleanupPolicy: { type: 'string', enum: [...CleanupPolicySchema.options] },
     tmuxAutoInstall: { type: 'boolean' },
     wslDistribution: { type: 'string' },
     terminalDefaultRuntime: { type: 'string', enum: ['wsl', 'powershell', 'native'] },
     terminalMaxCount: { type: 'number', minimum: 2, maximum: 16 },
     sessionRestoreEnabled: { type: 'boolean' },
     lastSession: { type: 'object' },
-    colorTheme: { type: 'string', enum: ['cyan', 'green', 'magenta', 'blue', 'yellow', 'red'] },
+    colorTheme: { type: 'string', enum: [...ColorThemeSchema.options] },
     presets: { type: 'object' },
     commandHooks: { type: 'object' },
   } as const,
@@ -41,14 +46,37 @@ export function getConfigPath(): string {
   return configStore.path;
 }
 
+// Last validated config keyed by the file's mtime and size (an external edit within the
+// same mtime tick usually changes the size); callers get a deep copy since they mutate it
+let cachedConfig: { mtimeMs: number; size: number; config: AppConfig } | null = null;
+
+function readValidatedConfig(): AppConfig {
+  let mtimeMs = -1;
+  let size = -1;
+  try {
+    const stats = statSync(configStore.path);
+    mtimeMs = stats.mtimeMs;
+    size = stats.size;
+  } catch {
+    // No file yet; conf serves the defaults
+  }
+
+  if (cachedConfig !== null && cachedConfig.mtimeMs === mtimeMs && cachedConfig.size === size) {
+    return structuredClone(cachedConfig.config);
+  }
+
+  const config = AppConfigSchema.parse(configStore.store);
+  cachedConfig = { mtimeMs, size, config: structuredClone(config) };
+  return config;
+}
+
 export function loadConfig(): AppConfig {
   try {
-    const raw = configStore.store;
-    const config = AppConfigSchema.parse(raw);
+    const config = readValidatedConfig();
 
-    const envToken = process.env[GITHUB_TOKEN_ENV];
-    if (envToken !== undefined && envToken.trim() !== '') {
-      config.githubToken = envToken.trim();
+    const envToken = process.env[GITHUB_TOKEN_ENV]?.trim() ?? '';
+    if (envToken !== '') {
+      config.githubToken = envToken;
     }
 
     return config;
@@ -67,10 +95,12 @@ export function loadConfig(): AppConfig {
 export function saveConfig(config: AppConfig): void {
   const validated = AppConfigSchema.parse(config);
   configStore.store = validated;
+  cachedConfig = null;
 }
 
 export function resetConfig(): AppConfig {
   configStore.store = DEFAULT_CONFIG;
+  cachedConfig = null;
   return { ...DEFAULT_CONFIG };
 }
 
@@ -99,10 +129,13 @@ export function updateGithubRepoCache(
   repos: Array<{ full_name: string; clone_url: string }>
 ): AppConfig {
   const config = loadConfig();
-  config.githubRepositoriesCache = repos.map((repo) => ({
-    full_name: repo.full_name,
-    clone_url: repo.clone_url,
-  }));
+  const byName = new Map<string, { full_name: string; clone_url: string }>();
+  for (const repo of repos) {
+    if (!byName.has(repo.full_name)) {
+      byName.set(repo.full_name, { full_name: repo.full_name, clone_url: repo.clone_url });
+    }
+  }
+  config.githubRepositoriesCache = [...byName.values()];
   saveConfig(config);
   return config;
 }
@@ -138,16 +171,16 @@ export function setConfigValue(key: string, value: string): AppConfig {
       config.githubToken = value;
       break;
     case 'defaultLayout':
-      if (['horizontal', 'vertical', 'grid'].includes(value)) {
-        config.defaultLayout = value as Layout;
+      if (isValidLayout(value)) {
+        config.defaultLayout = value;
       }
       break;
     case 'defaultPanes':
       config.defaultPanes = parseInt(value, 10);
       break;
     case 'cleanupPolicy':
-      if (['session', 'persistent'].includes(value)) {
-        config.cleanupPolicy = value as CleanupPolicy;
+      if (isValidCleanupPolicy(value)) {
+        config.cleanupPolicy = value;
       }
       break;
     case 'wslDistribution':
@@ -163,7 +196,7 @@ export function setConfigValue(key: string, value: string): AppConfig {
       config.sessionRestoreEnabled = value === 'true';
       break;
     case 'colorTheme':
-      if (['cyan', 'green', 'magenta', 'blue', 'yellow', 'red'].includes(value)) {
+      if (COLOR_THEME_VALUES.has(value)) {
         config.colorTheme = value as ColorTheme;
       }
       break;
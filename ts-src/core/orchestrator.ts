@@ -5,6 +5,7 @@ import {
   type WorktreeAssignment,
   type ManagedWorktree,
   createWorktreeAssignment,
+  sortByPane,
 } from '../types/index.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { validateDistribution } from '../runtime/wsl.js';
@@ -12,6 +13,7 @@ import { buildLayoutCommands } from '../tmux/layouts.js';
 import { startSession } from '../tmux/session.js';
 import { WorktreeManager } from '../git/worktree.js';
 import { materializeRemoteBranch } from '../git/clone.js';
+import { getLocalBranchSet } from '../git/branch.js';
 import { logger } from '../utils/logger.js';
 import { Platform, detectPlatform } from '../runtime/platform.js';
 
@@ -72,17 +74,28 @@ export async function orchestrate(request: OrchestrationRequest): Promise<Orches
 
   // Materialize remote branches
   const normalizedAssignments: WorktreeAssignment[] = [];
+  const localBranchesByRepo = new Map<string, Set<string> | null>();
   logger.debug('Preparing selected branches');
 
-  for (const assignment of request.assignments.sort((a, b) => a.pane - b.pane)) {
+  for (const assignment of sortByPane(request.assignments)) {
     let localBranch = assignment.branch;
 
     if (assignment.branch.startsWith('origin/')) {
       logger.debug(
-        `Materializing remote branch pane=${assignment.pane} repo=${assignment.repoPath} branch=${assignment.branch}`
+        () =>
+          `Materializing remote branch pane=${assignment.pane} repo=${assignment.repoPath} branch=${assignment.branch}`
       );
 
-      localBranch = await materializeRemoteBranch(assignment.repoPath, assignment.branch);
+      if (!localBranchesByRepo.has(assignment.repoPath)) {
+        localBranchesByRepo.set(assignment.repoPath, await getLocalBranchSet(assignment.repoPath));
+      }
+
+      // Without a listing, materializeRemoteBranch checks the branch itself
+      localBranch = await materializeRemoteBranch(
+        assignment.repoPath,
+        assignment.branch,
+        localBranchesByRepo.get(assignment.repoPath) ?? undefined
+      );
     }
 
     normalizedAssignments.push(
@@ -103,11 +116,10 @@ export async function orchestrate(request: OrchestrationRequest): Promise<Orches
     );
     logger.debug(`Created ${worktrees.length} worktrees`);
 
-    // Build tmux layout commands
-    const sorted = worktrees.sort((a, b) => a.pane - b.pane);
-    const panePaths = sorted.map((w) => w.path);
+    // Build tmux layout commands (materialize returns worktrees in pane order)
+    const panePaths = worktrees.map((w) => w.path);
     // Use original branch names for display, not internal fork names like main-pane-2
-    const paneBranches = request.displayBranches ?? sorted.map((w) => w.branch);
+    const paneBranches = request.displayBranches ?? worktrees.map((w) => w.branch);
 
     const tmuxCommands = buildLayoutCommands(
       sessionName,
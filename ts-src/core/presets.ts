@@ -7,6 +7,11 @@ export const TERMINAL_TEMPLATE_MIN = 2;
 export const TERMINAL_TEMPLATE_MAX = 16;
 export const TERMINAL_TEMPLATE_CUSTOM = 'custom';
 
+const TERMINAL_TEMPLATE_BY_NAME: ReadonlyMap<string, number> = new Map(
+  TERMINAL_TEMPLATE_CATALOG.map((count) => [String(count), count])
+);
+const TERMINAL_COUNT_RE = /^\d+$/;
+
 export function terminalTemplateChoices(): string[] {
   return [...TERMINAL_TEMPLATE_CATALOG.map(String), TERMINAL_TEMPLATE_CUSTOM];
 }
@@ -28,6 +33,10 @@ export function resolveTerminalTemplate(template: string | number, customValue?:
   }
 
   const normalized = template.trim().toLowerCase();
+  const catalogCount = TERMINAL_TEMPLATE_BY_NAME.get(normalized);
+  if (catalogCount !== undefined) {
+    return catalogCount;
+  }
 
   if (normalized === TERMINAL_TEMPLATE_CUSTOM) {
     if (customValue === undefined) {
@@ -40,7 +49,7 @@ export function resolveTerminalTemplate(template: string | number, customValue?:
     return validateTerminalCount(customValue);
   }
 
-  if (/^\d+$/.test(normalized)) {
+  if (TERMINAL_COUNT_RE.test(normalized)) {
     return validateTerminalCount(parseInt(normalized, 10));
   }
 
@@ -104,11 +113,13 @@ export function presetExists(name: string): boolean {
 
 export function createPresetFromCurrentConfig(name: string): PresetConfig {
   const config = loadConfig();
-  const preset: PresetConfig = {
+  const preset: PresetConfig = PresetConfigSchema.parse({
     layout: config.defaultLayout,
     panes: config.defaultPanes,
     cleanup: config.cleanupPolicy,
-  };
-  savePreset(name, preset);
+  });
+  // Reuse the loaded config instead of reloading it through savePreset
+  config.presets[name] = preset;
+  saveConfig(config);
   return preset;
 }
@@ -13,6 +13,12 @@ import { logger } from '../utils/logger.js';
 const TERMINAL_MIN = 2;
 const TERMINAL_MAX = 16;
 
+const RUNTIME_BY_VALUE: ReadonlyMap<string, RuntimeKind> = new Map<string, RuntimeKind>([
+  ['wsl', 'wsl'],
+  ['powershell', 'powershell'],
+  ['native', 'native'],
+]);
+
 function validateTerminalCount(value: number): number {
   if (value < TERMINAL_MIN || value > TERMINAL_MAX) {
     throw new Error(`Invalid terminal count: ${value}`);
@@ -81,11 +87,7 @@ export function parseRuntimeSnapshot(raw: unknown): RuntimeSessionSnapshot | nul
 }
 
 function normalizeRuntimeKind(value: string): RuntimeKind | null {
-  const normalized = value?.toLowerCase().trim();
-  if (normalized === 'wsl') return 'wsl';
-  if (normalized === 'powershell') return 'powershell';
-  if (normalized === 'native') return 'native';
-  return null;
+  return RUNTIME_BY_VALUE.get(value?.toLowerCase().trim() ?? '') ?? null;
 }
 
 export class SessionCleanupHandler {
@@ -141,7 +143,8 @@ export class SessionCleanupHandler {
       };
     }
 
-    const choice = await this.prompt(dirty.map((w) => w.path));
+    const dirtyPaths = dirty.map((w) => w.path);
+    const choice = await this.prompt(dirtyPaths);
     logger.info(`Cleanup prompt result choice=${choice} dirty_count=${dirty.length}`);
 
     if (choice === ExitChoice.CANCEL) {
@@ -149,7 +152,7 @@ export class SessionCleanupHandler {
         closed: false,
         cancelled: true,
         removed: [],
-        preservedDirty: dirty.map((w) => w.path),
+        preservedDirty: dirtyPaths,
       };
     }
 
@@ -163,7 +166,7 @@ export class SessionCleanupHandler {
         closed: true,
         cancelled: false,
         removed: removedClean,
-        preservedDirty: dirty.map((w) => w.path),
+        preservedDirty: dirtyPaths,
       };
     }
 
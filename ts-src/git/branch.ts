@@ -7,7 +7,51 @@ export interface BranchListResult {
   warning?: string;
 }
 
-export async function listLocalBranches(repoPath: string): Promise<BranchListResult> {
+export interface ListBranchesOptions {
+  /** Run `git fetch --all` before reading remote branches (default: true) */
+  fetch?: boolean;
+}
+
+// Branch listings include a `fetch --all`, so keep them for the lifetime of the process.
+// Keyed by repo path and fetch flag: an unfetched listing may lack remote branches.
+const branchListCache = new Map<string, Promise<BranchListResult>>();
+
+function branchListKey(repoPath: string, fetch: boolean): string {
+  return `${repoPath}\0${fetch}`;
+}
+
+export function refreshBranchCache(repoPath?: string): void {
+  if (repoPath === undefined) {
+    branchListCache.clear();
+  } else {
+    branchListCache.delete(branchListKey(repoPath, true));
+    branchListCache.delete(branchListKey(repoPath, false));
+  }
+}
+
+export function listLocalBranches(
+  repoPath: string,
+  options: ListBranchesOptions = {}
+): Promise<BranchListResult> {
+  const fetch = options.fetch ?? true;
+  const key = branchListKey(repoPath, fetch);
+  const cached = branchListCache.get(key);
+  if (cached !== undefined) {
+    logger.debug(`Using cached branch list for ${repoPath}`);
+    return cached;
+  }
+
+  const pending = loadBranches(repoPath, fetch);
+  branchListCache.set(key, pending);
+  pending.catch(() => {
+    if (branchListCache.get(key) === pending) {
+      branchListCache.delete(key);
+    }
+  });
+  return pending;
+}
+
+async function loadBranches(repoPath: string, fetch: boolean): Promise<BranchListResult> {
   logger.debug(`Listing local branches for ${repoPath}`);
 
   const git: SimpleGit = simpleGit(repoPath);
@@ -45,19 +89,22 @@ export async function listLocalBranches(repoPath: string): Promise<BranchListRes
   }
 
   try {
-    const localBranches = await git.branchLocal();
+    // git orders the listings itself; an explicit --sort overrides any branch.sort config
+    const localBranches = await git.branch(['--sort=refname']);
 
     // Filter out BranchNexus fork branches (e.g. main-pane-2, feature/x-pane-3)
     const FORK_BRANCH_RE = /-pane-\d+$/;
-    let branchNames = localBranches.all.filter((b) => !FORK_BRANCH_RE.test(b)).sort();
+    let branchNames = localBranches.all.filter((b) => !FORK_BRANCH_RE.test(b));
 
     // Also fetch remote branches for more options
     try {
-      await git.fetch(['--all']);
-      const remoteBranches = await git.branch(['-r']);
-      const remoteNames = remoteBranches.all
-        .filter((b) => !b.includes('HEAD') && !FORK_BRANCH_RE.test(b))
-        .sort();
+      if (fetch) {
+        await git.fetch(['--all']);
+      }
+      const remoteBranches = await git.branch(['-r', '--sort=refname']);
+      const remoteNames = remoteBranches.all.filter(
+        (b) => !b.includes('HEAD') && !FORK_BRANCH_RE.test(b)
+      );
 
       // Combine local and remote branches, local first
       branchNames = [...branchNames, ...remoteNames];
@@ -100,14 +147,40 @@ export async function getCurrentBranch(repoPath: string): Promise<string> {
   return status.current ?? 'HEAD';
 }
 
-export async function branchExists(repoPath: string, branch: string): Promise<boolean> {
+/**
+ * Reads all local branch names once so callers can answer repeated
+ * existence checks without spawning git per branch. Returns null when the
+ * listing fails, so callers cannot mistake a failure for "no branches".
+ */
+export async function getLocalBranchSet(repoPath: string): Promise<Set<string> | null> {
   const git: SimpleGit = simpleGit(repoPath);
-  const branches = await git.branchLocal();
-  return branches.all.includes(branch);
+
+  try {
+    const branches = await git.branchLocal();
+    return new Set(branches.all);
+  } catch (error) {
+    logger.debug(
+      `Local branch listing failed for ${repoPath}: ${error instanceof Error ? error.message : String(error)}`
+    );
+    return null;
+  }
 }
 
-export async function remoteBranchExists(repoPath: string, remoteBranch: string): Promise<boolean> {
+async function refExists(repoPath: string, ref: string): Promise<boolean> {
   const git: SimpleGit = simpleGit(repoPath);
-  const branches = await git.branch(['-r']);
-  return branches.all.includes(remoteBranch);
+  try {
+    // Exits 0 either way; prints the ref only when it exists
+    const output = await git.raw(['for-each-ref', '--format=%(refname)', ref]);
+    return output.trim() === ref;
+  } catch {
+    return false;
+  }
+}
+
+export async function branchExists(repoPath: string, branch: string): Promise<boolean> {
+  return refExists(repoPath, `refs/heads/${branch}`);
+}
+
+export async function remoteBranchExists(repoPath: string, remoteBranch: string): Promise<boolean> {
+  return refExists(repoPath, `refs/remotes/${remoteBranch}`);
 }
@@ -5,10 +5,20 @@ import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { posixPath } from '../utils/validators.js';
 import { parseGitHubUrl, checkRepoVisibility } from '../github/api.js';
 import { loadConfig } from '../core/config.js';
+import { branchExists } from './branch.js';
+
+// execa extends process.env by default, so only the override needs to be passed
+const NON_INTERACTIVE_GIT_ENV = { GIT_TERMINAL_PROMPT: '0' } as const;
+
+// The helper body is fixed; the token reaches it through the environment, not the command line
+const CLONE_TOKEN_ENV = 'BNX_CLONE_TOKEN';
+const TOKEN_CREDENTIAL_HELPER =
+  '!f() { echo "username=x-access-token"; echo "password=$BNX_CLONE_TOKEN"; }; f';
 
 export async function materializeRemoteBranch(
   repoPath: string,
-  remoteBranch: string
+  remoteBranch: string,
+  knownLocalBranches?: Set<string>
 ): Promise<string> {
   const normalizedRepo = posixPath(repoPath);
 
@@ -22,25 +32,25 @@ export async function materializeRemoteBranch(
 
   const localBranch = remoteBranch.split('/').slice(1).join('/');
   logger.debug(
-    `Materializing remote branch repo=${normalizedRepo} remote=${remoteBranch} local=${localBranch}`
+    () =>
+      `Materializing remote branch repo=${normalizedRepo} remote=${remoteBranch} local=${localBranch}`
   );
 
   const git: SimpleGit = simpleGit(normalizedRepo);
 
-  try {
-    const localBranches = await git.branchLocal();
-    if (localBranches.all.includes(localBranch)) {
+  if (knownLocalBranches !== undefined) {
+    if (knownLocalBranches.has(localBranch)) {
       logger.debug(`Local branch already exists: ${localBranch}`);
       return localBranch;
     }
-  } catch (error) {
-    logger.debug(
-      `Branch check failed, continuing with creation: ${error instanceof Error ? error.message : String(error)}`
-    );
+  } else if (await branchExists(normalizedRepo, localBranch)) {
+    logger.debug(`Local branch already exists: ${localBranch}`);
+    return localBranch;
   }
 
   try {
     await git.branch(['--track', localBranch, remoteBranch]);
+    knownLocalBranches?.add(localBranch);
     logger.debug(`Created tracking branch: ${localBranch}`);
     return localBranch;
   } catch (error) {
@@ -72,31 +82,24 @@ export async function cloneRepository(
 ): Promise<void> {
   logger.debug(`Cloning repository to ${targetPath}`);
 
+  // Progress output is never shown, so --quiet keeps the buffered stderr down to actual errors
+  const args = ['clone', '--quiet', url, targetPath];
+  // 0 disables the execa timeout, matching the previous unauthenticated clone path
+  let timeout = 0;
+  let env: Record<string, string> = NON_INTERACTIVE_GIT_ENV;
+
   if (token !== undefined && token !== '' && url.startsWith('https://')) {
     // Use git credential environment variables to pass the token securely.
-    // This avoids embedding the token in the URL where it could leak into
-    // git logs, process lists, or shell history.
+    // This avoids embedding the token in the URL or argv where it could leak
+    // into git logs, process lists, error messages, or shell history.
     const urlObj = new URL(url);
-    const credentialHelper = `!f() { echo "username=x-access-token"; echo "password=${token}"; }; f`;
-
-    try {
-      await execa(
-        'git',
-        ['-c', `credential.${urlObj.origin}.helper=${credentialHelper}`, 'clone', url, targetPath],
-        { timeout: 120000, env: { ...process.env, GIT_TERMINAL_PROMPT: '0' } }
-      );
-      logger.debug(`Cloned repository to ${targetPath}`);
-      return;
-    } catch (error) {
-      const message = error instanceof Error ? error.message : String(error);
-      throw new BranchNexusError(`Failed to clone repository: ${url}`, ExitCode.GIT_ERROR, message);
-    }
+    args.unshift('-c', `credential.${urlObj.origin}.helper=${TOKEN_CREDENTIAL_HELPER}`);
+    env = { ...NON_INTERACTIVE_GIT_ENV, [CLONE_TOKEN_ENV]: token };
+    timeout = 120000;
   }
 
-  const git: SimpleGit = simpleGit();
-
   try {
-    await git.clone(url, targetPath);
+    await execa('git', args, { timeout, env, stdout: 'ignore' });
     logger.debug(`Cloned repository to ${targetPath}`);
   } catch (error) {
     const message = error instanceof Error ? error.message : String(error);
@@ -1,12 +1,15 @@
 export {
   listLocalBranches,
+  refreshBranchCache,
   getCurrentBranch,
+  getLocalBranchSet,
   branchExists,
   remoteBranchExists,
   type BranchListResult,
+  type ListBranchesOptions,
 } from './branch.js';
 
-export { WorktreeManager } from './worktree.js';
+export { WorktreeManager, parseWorktreeList, type WorktreeListing } from './worktree.js';
 
 export {
   materializeRemoteBranch,
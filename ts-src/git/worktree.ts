@@ -5,49 +5,105 @@ import {
   type ManagedWorktree,
   type CleanupPolicy,
   createManagedWorktree,
+  sortByPane,
 } from '../types/index.js';
-import { runCommand, runCommandViaWSL } from '../runtime/shell.js';
-import { hasDistribution } from '../utils/validators.js';
+import {
+  runCommand,
+  runCommandViaWSL,
+  WslShellSession,
+  type ShellResult,
+} from '../runtime/shell.js';
+import { hasDistribution, posixPath, sanitizePathSegment } from '../utils/validators.js';
+
+export interface WorktreeListing {
+  /** Worktree paths keyed by full branch ref (refs/heads/...) */
+  byBranch: Map<string, string[]>;
+  paths: Set<string>;
+}
+
+// Only `worktree` and `branch` lines matter; HEAD/detached/locked lines are skipped by the scan
+const WORKTREE_LINE_RE = /^[ \t]*(worktree|branch) (.+)$/gm;
+
+/**
+ * Parses `git worktree list --porcelain` output in a single pass, collecting
+ * both the branch -> paths mapping and the set of all worktree paths.
+ */
+export function parseWorktreeList(stdout: string): WorktreeListing {
+  const byBranch = new Map<string, string[]>();
+  const paths = new Set<string>();
+  let currentWorktree = '';
+
+  for (const match of stdout.matchAll(WORKTREE_LINE_RE)) {
+    const value = match[2].trim();
+
+    if (match[1] === 'worktree') {
+      currentWorktree = value;
+      paths.add(currentWorktree);
+    } else if (currentWorktree !== '') {
+      const existing = byBranch.get(value);
+      if (existing) {
+        existing.push(currentWorktree);
+      } else {
+        byBranch.set(value, [currentWorktree]);
+      }
+    }
+  }
 
-const SANITIZE_PATTERN = /[^A-Za-z0-9._-]+/g;
+  return { byBranch, paths };
+}
+
+function keepPath(value: string): string {
+  return value;
+}
 
 export class WorktreeManager {
   private baseDir: string;
+  private normalizedBaseDir: string;
+  private baseDirPrefix: string;
   private cleanupPolicy: CleanupPolicy;
-  private posixMode: boolean;
-  private managed: ManagedWorktree[] = [];
+  // Resolved when the mode changes rather than re-checked on every call
+  private commandPath: (value: string) => string = keepPath;
+  // Keyed by command path so a worktree reused by several panes is tracked once
+  private managed = new Map<string, ManagedWorktree>();
+  private session: WslShellSession | null = null;
+  // Repos already pruned during the current materialize() batch
+  private prunedRepos: Set<string> | null = null;
+  // Parsed `git worktree list` per repo, valid until the batch changes that repo
+  private listings: Map<string, WorktreeListing> | null = null;
+  private repoDirNames = new Map<string, string>();
+  private branchSlugs = new Map<string, string>();
 
   constructor(baseDir: string, cleanupPolicy: CleanupPolicy = 'session') {
     this.baseDir = baseDir;
+    this.normalizedBaseDir = this.asPosix(baseDir);
+    this.baseDirPrefix = this.normalizedBaseDir.endsWith('/')
+      ? this.normalizedBaseDir
+      : `${this.normalizedBaseDir}/`;
     this.cleanupPolicy = cleanupPolicy;
-    this.posixMode = false;
   }
 
   setPosixMode(enabled: boolean): void {
-    this.posixMode = enabled;
-  }
-
-  private safe(value: string): string {
-    const cleaned = value.replace(SANITIZE_PATTERN, '-').replace(/^-+|-+$/g, '');
-    return cleaned || 'default';
+    this.commandPath = enabled ? posixPath : keepPath;
   }
 
   private asPosix(value: string): string {
-    let normalized = value.replace(/\\/g, '/');
-    while (normalized.startsWith('//')) {
-      normalized = normalized.slice(1);
-    }
-    return normalized;
-  }
-
-  private commandPath(value: string): string {
-    return this.posixMode ? this.asPosix(value) : value;
+    return posixPath(value);
   }
 
   buildWorktreePath(assignment: WorktreeAssignment): string {
-    const repoName = this.safe(this.asPosix(assignment.repoPath).split('/').pop() ?? 'repo');
-    // Strip bnx- prefix from branch name for cleaner path
-    const branchSlug = this.safe(assignment.branch.replace(/^bnx-/, '').replace(/^origin\//, ''));
+    let repoName = this.repoDirNames.get(assignment.repoPath);
+    if (repoName === undefined) {
+      repoName = sanitizePathSegment(this.asPosix(assignment.repoPath).split('/').pop() ?? 'repo');
+      this.repoDirNames.set(assignment.repoPath, repoName);
+    }
+    let branchSlug = this.branchSlugs.get(assignment.branch);
+    if (branchSlug === undefined) {
+      // Strip bnx- prefix from branch name for cleaner path
+      branchSlug = sanitizePathSegment(
+        assignment.branch.replace(/^bnx-/, '').replace(/^origin\//, '')
+      );
+      this.branchSlugs.set(assignment.branch, branchSlug);
+    }
     return `${this.baseDir}/${repoName}/${branchSlug}`;
   }
 
@@ -57,24 +113,24 @@ export class WorktreeManager {
   ): Promise<ManagedWorktree> {
     const target = this.buildWorktreePath(assignment);
     logger.debug(
-      `Adding worktree pane=${assignment.pane} repo=${assignment.repoPath} branch=${assignment.branch} target=${target}`
+      () =>
+        `Adding worktree pane=${assignment.pane} repo=${assignment.repoPath} branch=${assignment.branch} target=${target}`
     );
 
     const repoPath = this.commandPath(assignment.repoPath);
     const targetPath = this.commandPath(target);
 
-    // Prune stale worktree references first
-    const pruneCmd = ['git', '-C', repoPath, 'worktree', 'prune'];
-    try {
-      if (hasDistribution(distribution)) {
-        await runCommandViaWSL(distribution, pruneCmd);
-      } else {
-        await runCommand(pruneCmd);
+    // Prune stale worktree references first (once per repo within a batch)
+    if (this.prunedRepos?.has(repoPath) !== true) {
+      this.prunedRepos?.add(repoPath);
+      const pruneCmd = ['git', '-C', repoPath, 'worktree', 'prune'];
+      try {
+        await this.exec(pruneCmd, distribution);
+      } catch (error) {
+        logger.debug(
+          `Prune failed (non-critical): ${error instanceof Error ? error.message : String(error)}`
+        );
       }
-    } catch (error) {
-      logger.debug(
-        `Prune failed (non-critical): ${error instanceof Error ? error.message : String(error)}`
-      );
     }
 
     const existingWorktrees = await this.getWorktreesForBranch(
@@ -87,9 +143,7 @@ export class WorktreeManager {
       const existingPath = existingWorktrees[0];
       if (this.isUnderBaseDir(existingPath) || existingPath === repoPath) {
         logger.info(`Reusing existing worktree at ${existingPath}`);
-        const managed = createManagedWorktree(assignment, existingPath);
-        this.managed.push(managed);
-        return managed;
+        return this.track(createManagedWorktree(assignment, existingPath));
       }
 
       // Remove stale worktree from a previous run and continue
@@ -103,12 +157,9 @@ export class WorktreeManager {
         '--force',
         this.commandPath(existingPath),
       ];
+      this.listings?.delete(assignment.repoPath);
       try {
-        if (hasDistribution(distribution)) {
-          await runCommandViaWSL(distribution, removeCmd);
-        } else {
-          await runCommand(removeCmd);
-        }
+        await this.exec(removeCmd, distribution);
         logger.debug(`Removed stale worktree: ${existingPath}`);
       } catch (removeError) {
         logger.debug(
@@ -116,28 +167,16 @@ export class WorktreeManager {
         );
         // If remove fails, try prune and continue
         const pruneCmd = ['git', '-C', repoPath, 'worktree', 'prune'];
-        if (hasDistribution(distribution)) {
-          await runCommandViaWSL(distribution, pruneCmd);
-        } else {
-          await runCommand(pruneCmd);
-        }
+        await this.exec(pruneCmd, distribution);
         logger.debug('Pruned stale worktree references');
       }
     }
 
     const cmd = ['git', '-C', repoPath, 'worktree', 'add', targetPath, assignment.branch];
 
+    let result: ShellResult;
     try {
-      if (hasDistribution(distribution)) {
-        await runCommandViaWSL(distribution, cmd);
-      } else {
-        await runCommand(cmd);
-      }
-
-      logger.debug(`Created worktree at ${target}`);
-      const managed = createManagedWorktree(assignment, target);
-      this.managed.push(managed);
-      return managed;
+      result = await this.exec(cmd, distribution);
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       throw new BranchNexusError(
@@ -146,6 +185,18 @@ export class WorktreeManager {
         message
       );
     }
+
+    if (result.exitCode !== 0) {
+      throw new BranchNexusError(
+        `Failed to create worktree for pane ${assignment.pane}`,
+        ExitCode.GIT_ERROR,
+        result.stderr.trim() || `Exit code: ${result.exitCode}`
+      );
+    }
+    this.listings?.delete(assignment.repoPath);
+
+    logger.debug(`Created worktree at ${target}`);
+    return this.track(createManagedWorktree(assignment, target));
   }
 
   async materialize(
@@ -153,24 +204,72 @@ export class WorktreeManager {
     distribution?: string
   ): Promise<ManagedWorktree[]> {
     logger.debug(`Materializing ${assignments.length} worktree assignments`);
-    const created: ManagedWorktree[] = [];
 
-    for (const assignment of assignments.sort((a, b) => a.pane - b.pane)) {
-      created.push(await this.addWorktree(assignment, distribution));
+    // Sorted once; each result is written to its pane-order slot, so no re-sort is needed
+    const ordered = sortByPane(assignments);
+
+    // git locks a repo's worktree metadata, so each repo's panes are added serially
+    const groups = new Map<string, number[]>();
+    ordered.forEach((assignment, index) => {
+      const group = groups.get(assignment.repoPath);
+      if (group) {
+        group.push(index);
+      } else {
+        groups.set(assignment.repoPath, [index]);
+      }
+    });
+
+    if (hasDistribution(distribution)) {
+      this.session = new WslShellSession(distribution);
     }
+    this.prunedRepos = new Set();
+    this.listings = new Map();
+
+    try {
+      const created = new Array<ManagedWorktree>(ordered.length);
+
+      // Different repos proceed concurrently; every group settles before a failure
+      // is handled so the worktrees the other groups created can be rolled back here
+      const results = await Promise.allSettled(
+        [...groups.values()].map(async (indices) => {
+          for (const index of indices) {
+            created[index] = await this.addWorktree(ordered[index], distribution);
+          }
+        })
+      );
 
-    return created;
+      const failure = results.find(
+        (result): result is PromiseRejectedResult => result.status === 'rejected'
+      );
+      if (failure !== undefined) {
+        // The caller never receives a partial result, so it cannot roll these back itself
+        const partial = created.filter((worktree) => worktree !== undefined);
+        if (partial.length > 0) {
+          try {
+            await this.cleanup({ selected: partial, ignorePolicy: true, distribution });
+          } catch (cleanupError) {
+            logger.error(`Materialize rollback cleanup failed: ${String(cleanupError)}`);
+          }
+        }
+        throw failure.reason;
+      }
+      return created;
+    } finally {
+      this.session?.close();
+      this.session = null;
+      this.prunedRepos = null;
+      this.listings = null;
+    }
   }
 
   async checkDirty(worktree: ManagedWorktree, distribution?: string): Promise<boolean> {
-    const cmd = ['git', '-C', this.commandPath(worktree.path), 'status', '--porcelain'];
+    // -z skips git's path quoting; output is empty exactly when the tree is clean
+    const cmd = ['git', '-C', this.commandPath(worktree.path), 'status', '--porcelain', '-z'];
 
     try {
-      const result = hasDistribution(distribution)
-        ? await runCommandViaWSL(distribution, cmd)
-        : await runCommand(cmd);
+      const result = await this.exec(cmd, distribution);
 
-      const dirty = result.stdout.trim().length > 0;
+      const dirty = result.stdout.length > 0;
       logger.debug(`Dirty check path=${worktree.path} dirty=${dirty}`);
       return dirty;
     } catch (error) {
@@ -194,7 +293,31 @@ export class WorktreeManager {
       return [];
     }
 
-    const targets = options?.selected ?? this.managed;
+    const targets = options?.selected ?? [...this.managed.values()];
+    const distribution = options?.distribution;
+
+    // Route every removal through one WSL shell instead of a wsl.exe per worktree
+    let ownsSession = false;
+    if (this.session === null && hasDistribution(distribution) && targets.length > 1) {
+      this.session = new WslShellSession(distribution);
+      ownsSession = true;
+    }
+
+    try {
+      return await this.removeWorktrees(targets, options?.force !== false, distribution);
+    } finally {
+      if (ownsSession) {
+        this.session?.close();
+        this.session = null;
+      }
+    }
+  }
+
+  private async removeWorktrees(
+    targets: ManagedWorktree[],
+    force: boolean,
+    distribution?: string
+  ): Promise<string[]> {
     const removed: string[] = [];
     const removedPaths = new Set<string>();
 
@@ -206,17 +329,13 @@ export class WorktreeManager {
       removedPaths.add(worktreePath);
 
       const cmd = ['git', '-C', this.commandPath(worktree.repoPath), 'worktree', 'remove'];
-      if (options?.force !== false) {
+      if (force) {
         cmd.push('--force');
       }
       cmd.push(worktreePath);
 
       try {
-        if (hasDistribution(options?.distribution)) {
-          await runCommandViaWSL(options.distribution, cmd);
-        } else {
-          await runCommand(cmd);
-        }
+        await this.exec(cmd, distribution);
         removed.push(worktreePath);
         logger.debug(`Removed worktree at ${worktreePath}`);
       } catch (error) {
@@ -234,25 +353,42 @@ export class WorktreeManager {
 
   trackExisting(assignment: WorktreeAssignment, path: string): ManagedWorktree {
     logger.debug(
-      `Tracking existing worktree pane=${assignment.pane} branch=${assignment.branch} path=${path}`
+      () =>
+        `Tracking existing worktree pane=${assignment.pane} branch=${assignment.branch} path=${path}`
     );
-    const managed = createManagedWorktree(assignment, path);
-    this.managed.push(managed);
-    return managed;
+    return this.track(createManagedWorktree(assignment, path));
   }
 
   getManaged(): ManagedWorktree[] {
-    return [...this.managed];
+    return [...this.managed.values()];
   }
 
   getCleanupPolicy(): CleanupPolicy {
     return this.cleanupPolicy;
   }
 
+  private async exec(cmd: string[], distribution?: string): Promise<ShellResult> {
+    if (!hasDistribution(distribution)) {
+      return runCommand(cmd);
+    }
+    if (this.session !== null) {
+      return this.session.run(cmd);
+    }
+    return runCommandViaWSL(distribution, cmd);
+  }
+
+  private track(managed: ManagedWorktree): ManagedWorktree {
+    const key = this.commandPath(managed.path);
+    if (!this.managed.has(key)) {
+      this.managed.set(key, managed);
+    }
+    return managed;
+  }
+
   private isUnderBaseDir(path: string): boolean {
-    const normalizedBase = this.asPosix(this.baseDir);
-    const normalizedPath = this.asPosix(path);
-    return normalizedPath.startsWith(normalizedBase);
+    const candidate = this.asPosix(path);
+    // Compare against the separator-terminated prefix so /base-other is not under /base
+    return candidate === this.normalizedBaseDir || candidate.startsWith(this.baseDirPrefix);
   }
 
   private async getWorktreesForBranch(
@@ -260,32 +396,20 @@ export class WorktreeManager {
     branch: string,
     distribution?: string
   ): Promise<string[]> {
+    const expectedRef = branch.startsWith('refs/heads/') ? branch : `refs/heads/${branch}`;
+    const cached = this.listings?.get(repoPath);
+    if (cached !== undefined) {
+      return cached.byBranch.get(expectedRef) ?? [];
+    }
+
     const cmd = ['git', '-C', this.commandPath(repoPath), 'worktree', 'list', '--porcelain'];
 
     try {
-      const result = hasDistribution(distribution)
-        ? await runCommandViaWSL(distribution, cmd)
-        : await runCommand(cmd);
-
-      const worktrees: string[] = [];
-      let currentWorktree = '';
-      const expectedRef = branch.startsWith('refs/heads/') ? branch : `refs/heads/${branch}`;
-
-      for (const line of result.stdout.split('\n')) {
-        const trimmed = line.trim();
-        if (trimmed === '') continue;
-
-        if (trimmed.startsWith('worktree ')) {
-          currentWorktree = trimmed.slice(9).trim();
-        } else if (trimmed.startsWith('branch ') && currentWorktree !== '') {
-          const branchRef = trimmed.slice(7).trim();
-          if (branchRef === expectedRef) {
-            worktrees.push(currentWorktree);
-          }
-        }
-      }
+      const result = await this.exec(cmd, distribution);
 
-      return worktrees;
+      const listing = parseWorktreeList(result.stdout);
+      this.listings?.set(repoPath, listing);
+      return listing.byBranch.get(expectedRef) ?? [];
     } catch (error) {
       logger.debug(
         `Failed to list worktrees for branch ${branch}: ${error instanceof Error ? error.message : String(error)}`
@@ -15,24 +15,80 @@ export interface ParsedGitHubUrl {
 
 export type RepoVisibility = 'public' | 'private' | 'not_found' | 'error';
 
+// HTTPS: https://github.com/owner/repo.git or https://token@github.com/owner/repo
+// Userinfo excludes '/' so a long path without '@' cannot be rescanned as credentials
+const GITHUB_HTTPS_URL_RE = /^https?:\/\/(?:[^@/]+@)?github\.com\/([^/]+)\/([^/\s]+?)(?:\.git)?$/;
+// SSH: git@github.com:owner/repo.git
+const GITHUB_SSH_URL_RE = /^git@github\.com:([^/]+)\/([^/\s]+?)(?:\.git)?$/;
+
+const GITHUB_API_URL = 'https://api.github.com';
+// Next-page URL from a Link header: <https://...&page=2>; rel="next", <...>; rel="last"
+const LINK_NEXT_RE = /<([^>]+)>;\s*rel="next"/;
+
+type GitHubHeaders = Readonly<Record<string, string>>;
+
+const BASE_HEADERS: GitHubHeaders = Object.freeze({
+  Accept: 'application/vnd.github.v3+json',
+  'User-Agent': 'BranchNexus/1.0',
+});
+
+const MAX_CACHED_HEADER_SETS = 4;
+const authHeaderCache = new Map<string, GitHubHeaders>();
+
+/**
+ * Returns the request headers for a token. Header sets are shared and frozen,
+ * so copy before mutating.
+ */
+function githubHeaders(token?: string): GitHubHeaders {
+  if (token === undefined || token === '') {
+    return BASE_HEADERS;
+  }
+
+  let headers = authHeaderCache.get(token);
+  if (headers === undefined) {
+    if (authHeaderCache.size >= MAX_CACHED_HEADER_SETS) {
+      authHeaderCache.clear();
+    }
+    headers = Object.freeze({ ...BASE_HEADERS, Authorization: `Bearer ${token}` });
+    authHeaderCache.set(token, headers);
+  }
+  return headers;
+}
+
+const MAX_CACHED_PARSED_URLS = 64;
+const parsedUrlCache = new Map<string, Readonly<ParsedGitHubUrl> | null>();
+
 /**
  * Extracts owner/repo from GitHub URLs.
  * Supports HTTPS, SSH, and token-embedded URLs.
- * Returns null for non-GitHub URLs.
+ * Returns null for non-GitHub URLs. Results are cached and frozen.
  */
-export function parseGitHubUrl(url: string): ParsedGitHubUrl | null {
-  // HTTPS: https://github.com/owner/repo.git or https://token@github.com/owner/repo
-  const httpsMatch = url.match(
-    /^https?:\/\/(?:[^@]+@)?github\.com\/([^/]+)\/([^/\s]+?)(?:\.git)?$/
-  );
-  if (httpsMatch) {
-    return { owner: httpsMatch[1], repo: httpsMatch[2] };
+export function parseGitHubUrl(url: string): Readonly<ParsedGitHubUrl> | null {
+  const cached = parsedUrlCache.get(url);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const parsed = matchGitHubUrl(url);
+  if (parsedUrlCache.size >= MAX_CACHED_PARSED_URLS) {
+    parsedUrlCache.clear();
+  }
+  parsedUrlCache.set(url, parsed);
+  return parsed;
+}
+
+function matchGitHubUrl(url: string): Readonly<ParsedGitHubUrl> | null {
+  // Cheap substring check rejects non-GitHub URLs before any regex runs
+  if (!url.includes('github.com')) {
+    return null;
   }
 
-  // SSH: git@github.com:owner/repo.git
-  const sshMatch = url.match(/^git@github\.com:([^/]+)\/([^/\s]+?)(?:\.git)?$/);
-  if (sshMatch) {
-    return { owner: sshMatch[1], repo: sshMatch[2] };
+  // The two URL forms have disjoint prefixes, so only one pattern can match
+  const match = url.startsWith('git@')
+    ? GITHUB_SSH_URL_RE.exec(url)
+    : GITHUB_HTTPS_URL_RE.exec(url);
+  if (match) {
+    return Object.freeze({ owner: match[1], repo: match[2] });
   }
 
   return null;
@@ -48,16 +104,9 @@ export async function checkRepoVisibility(
   token?: string
 ): Promise<RepoVisibility> {
   try {
-    const headers: Record<string, string> = {
-      Accept: 'application/vnd.github.v3+json',
-      'User-Agent': 'BranchNexus/1.0',
-    };
-
-    if (token !== undefined && token !== '') {
-      headers['Authorization'] = `Bearer ${token}`;
-    }
-
-    const response = await fetch(`https://api.github.com/repos/${owner}/${repo}`, { headers });
+    const response = await fetch(`${GITHUB_API_URL}/repos/${owner}/${repo}`, {
+      headers: githubHeaders(token),
+    });
 
     if (response.ok) {
       const data = (await response.json()) as { private: boolean };
@@ -84,17 +133,13 @@ export class GitHubClient {
     this.token = token ?? process.env.BRANCHNEXUS_GH_TOKEN ?? '';
   }
 
-  private async fetch(endpoint: string): Promise<unknown> {
+  private async request(url: string): Promise<Response> {
     if (this.token === '') {
       throw new Error('GitHub token is required. Set BRANCHNEXUS_GH_TOKEN env var.');
     }
 
-    const response = await fetch(`https://api.github.com${endpoint}`, {
-      headers: {
-        Authorization: `Bearer ${this.token}`,
-        Accept: 'application/vnd.github.v3+json',
-        'User-Agent': 'BranchNexus/1.0',
-      },
+    const response = await fetch(url, {
+      headers: githubHeaders(this.token),
     });
 
     if (!response.ok) {
@@ -102,27 +147,50 @@ export class GitHubClient {
       throw new Error(`GitHub API error: ${response.status} ${error}`);
     }
 
+    return response;
+  }
+
+  private async fetch(endpoint: string): Promise<unknown> {
+    const response = await this.request(`${GITHUB_API_URL}${endpoint}`);
     return response.json();
   }
 
+  /** Fetches a list endpoint, following the Link header's rel="next" pages */
+  private async fetchAllPages<T>(endpoint: string): Promise<T[]> {
+    const items: T[] = [];
+    let url: string | undefined = `${GITHUB_API_URL}${endpoint}`;
+
+    while (url !== undefined) {
+      const response = await this.request(url);
+      items.push(...((await response.json()) as T[]));
+      url = LINK_NEXT_RE.exec(response.headers.get('link') ?? '')?.[1];
+    }
+
+    return items;
+  }
+
   async listRepositories(): Promise<GitHubRepo[]> {
-    const data = (await this.fetch('/user/repos?per_page=100&sort=updated')) as Array<{
+    const data = await this.fetchAllPages<{
       full_name: string;
       clone_url: string;
-    }>;
-
-    return data.map((repo) => ({
-      fullName: repo.full_name,
-      cloneUrl: repo.clone_url,
-    }));
+    }>('/user/repos?per_page=100&sort=updated');
+
+    // Pages can overlap when a repo's update time changes mid-listing; keep the first copy
+    const byName = new Map<string, GitHubRepo>();
+    for (const repo of data) {
+      if (!byName.has(repo.full_name)) {
+        byName.set(repo.full_name, { fullName: repo.full_name, cloneUrl: repo.clone_url });
+      }
+    }
+    return [...byName.values()];
   }
 
   async listBranches(owner: string, repo: string): Promise<GitHubBranch[]> {
-    const data = (await this.fetch(`/repos/${owner}/${repo}/branches?per_page=100`)) as Array<{
-      name: string;
-    }>;
-
-    const defaultBranch = await this.getDefaultBranch(owner, repo);
+    // The branch pages and the default-branch lookup are independent; issue them together
+    const [data, defaultBranch] = await Promise.all([
+      this.fetchAllPages<{ name: string }>(`/repos/${owner}/${repo}/branches?per_page=100`),
+      this.getDefaultBranch(owner, repo),
+    ]);
 
     return data.map((branch) => ({
       name: branch.name,
@@ -17,10 +17,26 @@ export interface HookRunResult {
   hasFailures: boolean;
 }
 
+const TIMEOUT_RE = /timed out/i;
+// Hook results are kept for the whole run; only the tail of a chatty command is retained
+const MAX_HOOK_OUTPUT_CHARS = 16 * 1024;
+
+function keepTail(output: string): string {
+  return output.length > MAX_HOOK_OUTPUT_CHARS ? output.slice(-MAX_HOOK_OUTPUT_CHARS) : output;
+}
+
+function combineOutput(stdout: string, stderr: string): string {
+  const out = stdout.trim();
+  const err = stderr.trim();
+  if (err === '') return keepTail(out);
+  if (out === '') return keepTail(err);
+  return keepTail(`${stdout}${stderr}`.trim());
+}
+
 export class HookRunner {
   private timeoutSeconds: number;
   private trustedConfig: boolean;
-  private allowCommandPrefixes: string[];
+  private allowCommandPrefixes: ReadonlySet<string>;
 
   constructor(options?: {
     timeoutSeconds?: number;
@@ -29,7 +45,7 @@ export class HookRunner {
   }) {
     this.timeoutSeconds = options?.timeoutSeconds ?? 30;
     this.trustedConfig = options?.trustedConfig ?? true;
-    this.allowCommandPrefixes = options?.allowCommandPrefixes ?? [];
+    this.allowCommandPrefixes = new Set(options?.allowCommandPrefixes ?? []);
   }
 
   private isCommandAllowed(command: string): boolean {
@@ -42,16 +58,21 @@ export class HookRunner {
       return false;
     }
 
-    if (this.allowCommandPrefixes.length === 0) {
+    if (this.allowCommandPrefixes.size === 0) {
       return false;
     }
 
-    return this.allowCommandPrefixes.includes(argv[0]);
+    return this.allowCommandPrefixes.has(argv[0]);
   }
 
   async run(pane: number, commands: string[], distribution?: string): Promise<HookRunResult> {
     const executions: HookExecution[] = [];
-    logger.debug(`Running ${commands.length} hook commands for pane=${pane}`);
+    logger.debug(() => `Running ${commands.length} hook commands for pane=${pane}`);
+    // The wrapping decision is the same for every command in this batch
+    const wslDistribution =
+      detectPlatform() === Platform.WINDOWS && hasDistribution(distribution)
+        ? distribution
+        : undefined;
 
     for (const command of commands) {
       if (!this.isCommandAllowed(command)) {
@@ -66,21 +87,19 @@ export class HookRunner {
       }
 
       try {
-        logger.debug(`Executing hook command pane=${pane} command=${command}`);
+        logger.debug(() => `Executing hook command pane=${pane} command=${command}`);
 
-        const isWindows = detectPlatform() === Platform.WINDOWS;
         const cmd = ['bash', '-lc', command];
         const finalCmd =
-          isWindows && hasDistribution(distribution) ? buildWslCommand(distribution, cmd) : cmd;
+          wslDistribution !== undefined ? buildWslCommand(wslDistribution, cmd) : cmd;
 
         const result = await execa(finalCmd[0], finalCmd.slice(1), {
           timeout: this.timeoutSeconds * 1000,
           reject: false,
-          all: true,
         });
 
         const success = result.exitCode === 0;
-        const output = `${result.stdout}${result.stderr}`.trim();
+        const output = combineOutput(result.stdout, result.stderr);
 
         if (!success) {
           logger.warn(
@@ -95,7 +114,7 @@ export class HookRunner {
           output,
         });
       } catch (error) {
-        const isTimeout = error instanceof Error && error.message.includes('timed out');
+        const isTimeout = error instanceof Error && TIMEOUT_RE.test(error.message);
         logger.error(
           `Hook command ${isTimeout ? 'timed out' : 'failed'} pane=${pane} command=${command}`
         );
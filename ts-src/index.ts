@@ -27,7 +27,7 @@ export {
 } from './core/orchestrator.js';
 
 export { WorktreeManager } from './git/worktree.js';
-export { listLocalBranches, type BranchListResult } from './git/branch.js';
+export { listLocalBranches, refreshBranchCache, type BranchListResult } from './git/branch.js';
 
 export { buildLayoutCommands, validateLayout } from './tmux/layouts.js';
 export {
@@ -39,7 +39,13 @@ export {
 } from './tmux/session.js';
 
 export { detectPlatform, Platform, hasTmux, expandHomeDir } from './runtime/platform.js';
-export { listDistributions, buildWslCommand, toWslPath } from './runtime/wsl.js';
+export {
+  listDistributions,
+  refreshDistributionCache,
+  buildWslCommand,
+  buildWslExecCommand,
+  toWslPath,
+} from './runtime/wsl.js';
 export { runCommand, runCommandViaWSL, type ShellResult } from './runtime/shell.js';
 
 export {
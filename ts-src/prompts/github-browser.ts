@@ -51,6 +51,8 @@ export interface GitHubBrowserResult {
 
 interface BrowserState {
   repos: GitHubRepo[];
+  /** Lower-cased fullName per repo, computed once when the list loads */
+  repoSearchKeys: string[];
   filteredRepos: GitHubRepo[];
   selectedIndex: number;
   scrollOffset: number;
@@ -139,6 +141,7 @@ export async function showGitHubBrowser(token: string): Promise<GitHubBrowserRes
 
   const state: BrowserState = {
     repos: [],
+    repoSearchKeys: [],
     filteredRepos: [],
     selectedIndex: 0,
     scrollOffset: 0,
@@ -185,7 +188,7 @@ export async function showGitHubBrowser(token: string): Promise<GitHubBrowserRes
         state.filteredRepos = [...state.repos];
       } else {
         const lower = state.filterText.toLowerCase();
-        state.filteredRepos = state.repos.filter((r) => r.fullName.toLowerCase().includes(lower));
+        state.filteredRepos = state.repos.filter((_, i) => state.repoSearchKeys[i].includes(lower));
       }
       state.selectedIndex = 0;
       state.scrollOffset = 0;
@@ -289,6 +292,7 @@ export async function showGitHubBrowser(token: string): Promise<GitHubBrowserRes
       .listRepositories()
       .then((repos) => {
         state.repos = repos;
+        state.repoSearchKeys = repos.map((r) => r.fullName.toLowerCase());
         state.filteredRepos = [...repos];
         state.loading = false;
 
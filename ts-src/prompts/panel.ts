@@ -587,8 +587,14 @@ const RANDOM_NAMES = [
 ];
 
 function pickRandomNames(count: number): string[] {
-  const shuffled = [...RANDOM_NAMES].sort(() => Math.random() - 0.5);
-  return shuffled.slice(0, count);
+  // Partial Fisher-Yates: only shuffle the prefix we actually hand out
+  const pool = [...RANDOM_NAMES];
+  const take = Math.min(count, pool.length);
+  for (let i = 0; i < take; i++) {
+    const j = i + Math.floor(Math.random() * (pool.length - i));
+    [pool[i], pool[j]] = [pool[j], pool[i]];
+  }
+  return pool.slice(0, take);
 }
 
 interface BranchFormState {
@@ -617,10 +623,11 @@ function renderBranchForm(
   lines.push(boxMid(W));
   lines.push(boxLine('', W));
 
-  // Count how many times each branch is used to show duplicate hint
-  const usageCount = new Map<number, number>();
+  // Count how many times each branch is used to show duplicate hint; branch indices are
+  // dense, so a flat counter array indexed by branch replaces a Map of boxed entries
+  const usageCount = new Uint16Array(branches.length);
   for (const bi of state.branchIndices) {
-    usageCount.set(bi, (usageCount.get(bi) ?? 0) + 1);
+    usageCount[bi]++;
   }
 
   for (let i = 0; i < paneCount; i++) {
@@ -648,7 +655,7 @@ function renderBranchForm(
     const nameDisplay = focused ? pal.primaryBold(name.padEnd(10)) : chalk.white(name.padEnd(10));
     const branchName = branches[state.branchIndices[i]];
     const shortBranch = branchName.length > 22 ? '...' + branchName.slice(-19) : branchName;
-    const isDuplicate = (usageCount.get(state.branchIndices[i]) ?? 0) > 1;
+    const isDuplicate = usageCount[state.branchIndices[i]] > 1;
     const dupHint = isDuplicate ? chalk.yellow(' +fork') : '';
     const cmdHint = state.startupCommands[i] !== '' ? chalk.dim(' $') : '';
     const branchDisplay = selectDisplay(shortBranch, focused, pal) + dupHint + cmdHint;
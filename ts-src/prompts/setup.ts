@@ -2,7 +2,7 @@ import inquirer from 'inquirer';
 import chalk from 'chalk';
 import { type AppConfig, type Layout, type CleanupPolicy, DEFAULT_CONFIG } from '../types/index.js';
 import { loadConfig, saveConfig, setWslDistribution, setGithubToken } from '../core/config.js';
-import { detectPlatform, Platform, hasTmux } from '../runtime/platform.js';
+import { detectPlatform, Platform, hasTmux, getTmuxInstallCommand } from '../runtime/platform.js';
 import { listDistributions } from '../runtime/wsl.js';
 import { logger } from '../utils/logger.js';
 import { execa } from 'execa';
@@ -31,24 +31,13 @@ async function installTmux(): Promise<boolean> {
   if (platform === Platform.MACOS) {
     cmd = 'brew install tmux';
   } else {
-    // Linux/WSL - try apt first, then other package managers
-    try {
-      await execa('bash', ['-lc', 'which apt-get']);
-      cmd = 'sudo apt-get update && sudo apt-get install -y tmux';
-    } catch {
-      try {
-        await execa('bash', ['-lc', 'which dnf']);
-        cmd = 'sudo dnf install -y tmux';
-      } catch {
-        try {
-          await execa('bash', ['-lc', 'which pacman']);
-          cmd = 'sudo pacman -S --noconfirm tmux';
-        } catch {
-          console.log(chalk.red('Could not detect package manager. Please install tmux manually.'));
-          return false;
-        }
-      }
+    // Linux/WSL
+    const installCmd = await getTmuxInstallCommand();
+    if (installCmd === null) {
+      console.log(chalk.red('Could not detect package manager. Please install tmux manually.'));
+      return false;
     }
+    cmd = `sudo sh -c '${installCmd}'`;
   }
 
   console.log(chalk.dim(`Running: ${cmd}`));
@@ -4,6 +4,7 @@ export {
   isWSL,
   hasTmux,
   getTmuxVersion,
+  getTmuxInstallCommand,
   expandHomeDir,
   getHomeDir,
   getPlatformInfo,
@@ -11,8 +12,10 @@ export {
 
 export {
   listDistributions,
+  refreshDistributionCache,
   validateDistribution,
   buildWslCommand,
+  buildWslExecCommand,
   toWslPath,
   distributionUnreachableMessage,
 } from './wsl.js';
@@ -22,6 +25,7 @@ export {
   runCommandViaWSL,
   runCommandChecked,
   runCommandViaWSLChecked,
+  WslShellSession,
   type ShellResult,
   type RunCommandOptions,
 } from './shell.js';
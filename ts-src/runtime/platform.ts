@@ -36,9 +36,17 @@ export function isWSL(): boolean {
   }
 }
 
+// Only a positive result is remembered so a check after installing tmux still probes again
+let tmuxFound = false;
+
 export async function hasTmux(): Promise<boolean> {
+  if (tmuxFound) {
+    return true;
+  }
+
   try {
     await execa('tmux', ['-V']);
+    tmuxFound = true;
     return true;
   } catch {
     return false;
@@ -55,6 +63,33 @@ export async function getTmuxVersion(): Promise<string | null> {
   }
 }
 
+// Package managers in priority order, each with the command (run as root) that installs tmux
+const TMUX_INSTALL_COMMANDS: Readonly<Record<string, string>> = {
+  'apt-get': 'apt-get update && apt-get install -y tmux',
+  dnf: 'dnf install -y tmux',
+  pacman: 'pacman -S --noconfirm tmux',
+  apk: 'apk add tmux',
+};
+
+// Prints the first of "$@" found on PATH; exits non-zero when none is
+const PACKAGE_MANAGER_PROBE =
+  'for m in "$@"; do command -v "$m" >/dev/null 2>&1 && { echo "$m"; exit 0; }; done; exit 1';
+
+/**
+ * Returns the root command that installs tmux with the first available package
+ * manager, or null when none is found. One shell probes all managers.
+ */
+export async function getTmuxInstallCommand(): Promise<string | null> {
+  const managers = Object.keys(TMUX_INSTALL_COMMANDS);
+  const probe = await execa('sh', ['-c', PACKAGE_MANAGER_PROBE, 'sh', ...managers], {
+    reject: false,
+  });
+  if (probe.exitCode !== 0) {
+    return null;
+  }
+  return TMUX_INSTALL_COMMANDS[probe.stdout.trim()] ?? null;
+}
+
 export function expandHomeDir(filepath: string): string {
   if (filepath.startsWith('~/')) {
     return path.join(os.homedir(), filepath.slice(2));
@@ -1,3 +1,4 @@
+import { spawn, type ChildProcessWithoutNullStreams } from 'node:child_process';
 import { execa, type ExecaError } from 'execa';
 import { logger } from '../utils/logger.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
@@ -20,8 +21,12 @@ export async function runCommand(
   command: string[],
   options: RunCommandOptions = {}
 ): Promise<ShellResult> {
+  logger.debug(() => `Running command: ${command.join(' ')}`);
+  return execCommand(command, options);
+}
+
+async function execCommand(command: string[], options: RunCommandOptions): Promise<ShellResult> {
   const [cmd, ...args] = command;
-  logger.debug(`Running command: ${command.join(' ')}`);
 
   try {
     const result = await execa(cmd, args, {
@@ -29,7 +34,6 @@ export async function runCommand(
       timeout: options.timeout ?? 30000,
       input: options.input,
       reject: false,
-      all: true,
     });
 
     return {
@@ -61,8 +65,17 @@ export async function runCommandViaWSL(
   options: RunCommandOptions = {}
 ): Promise<ShellResult> {
   const wrapped = buildWslCommand(distribution, command);
-  logger.debug(`Running WSL command: ${wrapped.join(' ')}`);
-  return runCommand(wrapped, options);
+  logger.debug(() => `Running WSL command: ${wrapped.join(' ')}`);
+  return execCommand(wrapped, options);
+}
+
+const FAILURE_DETAIL_LIMIT = 512;
+
+/** Trailing stderr (or stdout when stderr is empty) used as the hint of a failed command */
+function failureDetails(result: ShellResult): string {
+  const raw = result.stderr !== '' ? result.stderr : result.stdout;
+  const tail = raw.length > FAILURE_DETAIL_LIMIT ? raw.slice(-FAILURE_DETAIL_LIMIT) : raw;
+  return tail.trim() || `Exit code: ${result.exitCode}`;
 }
 
 export async function runCommandChecked(
@@ -75,7 +88,7 @@ export async function runCommandChecked(
     throw new BranchNexusError(
       `Command failed: ${command.join(' ')}`,
       ExitCode.RUNTIME_ERROR,
-      result.stderr || `Exit code: ${result.exitCode}`
+      failureDetails(result)
     );
   }
 
@@ -93,9 +106,196 @@ export async function runCommandViaWSLChecked(
     throw new BranchNexusError(
       `WSL command failed: ${command.join(' ')}`,
       ExitCode.RUNTIME_ERROR,
-      result.stderr || `Exit code: ${result.exitCode}`
+      failureDetails(result)
     );
   }
 
   return result;
 }
+
+const SESSION_MARKER = '__BNX_DONE_';
+const SAFE_SHELL_ARG = /^[A-Za-z0-9_@%+=:,./-]+$/;
+
+function shellQuote(arg: string): string {
+  if (SAFE_SHELL_ARG.test(arg)) {
+    return arg;
+  }
+  return `'${arg.replace(/'/g, `'\\''`)}'`;
+}
+
+function stripFinalNewline(value: string): string {
+  return value.endsWith('\n') ? value.slice(0, -1) : value;
+}
+
+interface PendingSessionCommand {
+  marker: string;
+  resolve: (result: ShellResult) => void;
+}
+
+/**
+ * Long-lived `wsl.exe -d <distro> -- bash` process that dispatches commands
+ * over stdin, so a batch of git calls pays the wsl.exe start-up cost once.
+ * Each command runs in a subshell and is terminated by a marker line carrying
+ * its exit code.
+ */
+export class WslShellSession {
+  private distribution: string;
+  private child: ChildProcessWithoutNullStreams | null = null;
+  private pending: PendingSessionCommand | null = null;
+  private queue: Promise<unknown> = Promise.resolve();
+  private stdoutBuffer = '';
+  private stderrBuffer = '';
+  private sequence = 0;
+
+  constructor(distribution: string) {
+    this.distribution = distribution;
+  }
+
+  run(command: string[], options: RunCommandOptions = {}): Promise<ShellResult> {
+    if (options.input !== undefined) {
+      return runCommandViaWSL(this.distribution, command, options);
+    }
+
+    const next = this.queue.then(() => this.dispatch(command, options));
+    this.queue = next.catch(() => undefined);
+    return next;
+  }
+
+  close(): void {
+    this.terminate('WSL shell session closed');
+  }
+
+  private start(): ChildProcessWithoutNullStreams {
+    if (this.child !== null) {
+      return this.child;
+    }
+
+    const wrapped = buildWslCommand(this.distribution, ['bash', '--noprofile', '--norc']);
+    logger.debug(() => `Starting WSL shell session: ${wrapped.join(' ')}`);
+
+    const child = spawn(wrapped[0], wrapped.slice(1), { stdio: 'pipe' });
+    child.stdout.setEncoding('utf8');
+    child.stderr.setEncoding('utf8');
+    // A timed-out child is killed but may still flush output; only the current one counts
+    child.stdout.on('data', (chunk: string) => {
+      if (this.child === child) {
+        this.stdoutBuffer += chunk;
+        this.settle();
+      }
+    });
+    child.stderr.on('data', (chunk: string) => {
+      if (this.child === child) {
+        this.stderrBuffer += chunk;
+        this.settle();
+      }
+    });
+    child.stdin.on('error', (error) => {
+      this.abort(child, error.message);
+    });
+    child.on('error', (error) => {
+      this.abort(child, error.message);
+    });
+    child.on('exit', (code) => {
+      this.abort(child, `WSL shell session exited with code ${code ?? 'unknown'}`);
+    });
+
+    this.child = child;
+    return child;
+  }
+
+  private async dispatch(command: string[], options: RunCommandOptions): Promise<ShellResult> {
+    if (this.child === null) {
+      this.start();
+      // Anything printed while the shell starts is drained by this no-op instead of
+      // being attributed to the first real command. If the shell dies or is closed
+      // meanwhile, report that rather than starting another one.
+      const ready = await this.send(['true'], { timeout: options.timeout });
+      if (ready.exitCode !== 0) {
+        return ready;
+      }
+    }
+    return this.send(command, options);
+  }
+
+  private send(command: string[], options: RunCommandOptions): Promise<ShellResult> {
+    const child = this.start();
+    this.sequence += 1;
+    const marker = `${SESSION_MARKER}${this.sequence}`;
+    const cwd = options.cwd !== undefined ? `cd ${shellQuote(options.cwd)} && ` : '';
+    const script = `(${cwd}${command.map(shellQuote).join(' ')}) </dev/null`;
+    logger.debug(() => `Running WSL session command: ${command.join(' ')}`);
+
+    return new Promise<ShellResult>((resolve) => {
+      const timer = setTimeout(() => {
+        this.pending = null;
+        this.close();
+        resolve({ exitCode: 124, stdout: '', stderr: 'Command timed out.' });
+      }, options.timeout ?? 30000);
+
+      this.pending = {
+        marker,
+        resolve: (result) => {
+          clearTimeout(timer);
+          resolve(result);
+        },
+      };
+
+      child.stdin.write(
+        `${script}; printf '\\n${marker} %d\\n' $?; printf '\\n${marker}\\n' >&2\n`
+      );
+    });
+  }
+
+  private settle(): void {
+    const pending = this.pending;
+    if (pending === null) {
+      return;
+    }
+
+    const outStart = this.stdoutBuffer.indexOf(`\n${pending.marker} `);
+    const errStart = this.stderrBuffer.indexOf(`\n${pending.marker}\n`);
+    if (outStart === -1 || errStart === -1) {
+      return;
+    }
+
+    const codeStart = outStart + pending.marker.length + 2;
+    const outEnd = this.stdoutBuffer.indexOf('\n', codeStart);
+    if (outEnd === -1) {
+      return;
+    }
+
+    const exitCode = Number.parseInt(this.stdoutBuffer.slice(codeStart, outEnd), 10);
+    const stdout = stripFinalNewline(this.stdoutBuffer.slice(0, outStart));
+    const stderr = stripFinalNewline(this.stderrBuffer.slice(0, errStart));
+
+    this.stdoutBuffer = this.stdoutBuffer.slice(outEnd + 1);
+    this.stderrBuffer = this.stderrBuffer.slice(errStart + pending.marker.length + 2);
+    this.pending = null;
+
+    pending.resolve({ exitCode: Number.isNaN(exitCode) ? 1 : exitCode, stdout, stderr });
+  }
+
+  private abort(child: ChildProcessWithoutNullStreams, message: string): void {
+    if (this.child === child) {
+      this.terminate(message);
+    }
+  }
+
+  // Stops the shell and fails any in-flight command, so it does not wait for its timeout
+  private terminate(message: string): void {
+    const child = this.child;
+    this.child = null;
+    this.stdoutBuffer = '';
+    this.stderrBuffer = '';
+    if (child !== null) {
+      child.stdin.end();
+      child.kill();
+    }
+
+    const pending = this.pending;
+    if (pending !== null) {
+      this.pending = null;
+      pending.resolve({ exitCode: 1, stdout: '', stderr: message });
+    }
+  }
+}
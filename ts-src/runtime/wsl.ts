@@ -3,7 +3,41 @@ import { logger } from '../utils/logger.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { Platform, detectPlatform } from './platform.js';
 
+const WINDOWS_DRIVE_PATH_RE = /^([A-Za-z]):[/\\](.*)$/;
+
+// wslpath results keyed by distribution and host path; a mount mapping does not change mid-run
+const wslPathCache = new Map<string, string>();
+
+// `wsl.exe -l` is slow, and one run can list distributions several times (run + prompt)
+const DISTRIBUTION_CACHE_TTL_MS = 10_000;
+let distributionCache: { expiresAt: number; distros: Promise<string[]> } | null = null;
+
+export function refreshDistributionCache(): void {
+  distributionCache = null;
+}
+
 export async function listDistributions(): Promise<string[]> {
+  const now = Date.now();
+  let entry = distributionCache;
+  if (entry === null || entry.expiresAt <= now) {
+    const created = {
+      expiresAt: now + DISTRIBUTION_CACHE_TTL_MS,
+      distros: discoverDistributions(),
+    };
+    // Failures are not cached
+    created.distros.catch(() => {
+      if (distributionCache === created) {
+        distributionCache = null;
+      }
+    });
+    distributionCache = created;
+    entry = created;
+  }
+
+  return [...(await entry.distros)];
+}
+
+async function discoverDistributions(): Promise<string[]> {
   logger.debug('Listing WSL distributions using wsl.exe -l -q');
 
   if (detectPlatform() !== Platform.WINDOWS) {
@@ -20,11 +54,16 @@ export async function listDistributions(): Promise<string[]> {
     });
 
     const output = decodeWslOutput(result.stdout);
-    const distros = output
-      .split('\n')
-      .map((line) => line.trim())
-      .filter((line) => line.length > 0)
-      .sort();
+    // WSL distribution names are case-insensitive; keep the first spelling seen
+    const byName = new Map<string, string>();
+    for (const line of output.split('\n')) {
+      const name = line.trim();
+      const key = name.toLowerCase();
+      if (name !== '' && !byName.has(key)) {
+        byName.set(key, name);
+      }
+    }
+    const distros = [...byName.values()].sort();
 
     if (distros.length === 0) {
       throw new BranchNexusError(
@@ -65,7 +104,7 @@ export function validateDistribution(distribution: string, available: string[]):
   return available.includes(distribution);
 }
 
-export function buildWslCommand(distribution: string, command: string[]): string[] {
+function assertWslCommand(distribution: string, command: string[]): void {
   if (distribution === '') {
     throw new BranchNexusError(
       'WSL distribution is required.',
@@ -81,10 +120,22 @@ export function buildWslCommand(distribution: string, command: string[]): string
       'Provide a command to execute in WSL.'
     );
   }
+}
 
+export function buildWslCommand(distribution: string, command: string[]): string[] {
+  assertWslCommand(distribution, command);
   return ['wsl.exe', '-d', distribution, '--', ...command];
 }
 
+/**
+ * Runs the command directly (`--exec`) rather than through the distribution's
+ * default shell, so arguments such as tmux's `;` separator reach it verbatim.
+ */
+export function buildWslExecCommand(distribution: string, command: string[]): string[] {
+  assertWslCommand(distribution, command);
+  return ['wsl.exe', '-d', distribution, '--exec', ...command];
+}
+
 export async function toWslPath(distribution: string, hostPath: string): Promise<string> {
   const normalized = hostPath.replace(/\\/g, '/');
 
@@ -92,12 +143,19 @@ export async function toWslPath(distribution: string, hostPath: string): Promise
     return normalized;
   }
 
+  const cacheKey = `${distribution}\0${normalized}`;
+  const cached = wslPathCache.get(cacheKey);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   try {
     const cmd = buildWslCommand(distribution, ['wslpath', '-a', normalized]);
     const result = await execa(cmd[0], cmd.slice(1));
     const wslPath = result.stdout.trim();
 
     if (wslPath !== '') {
+      wslPathCache.set(cacheKey, wslPath);
       return wslPath;
     }
   } catch {
@@ -108,7 +166,7 @@ export async function toWslPath(distribution: string, hostPath: string): Promise
 }
 
 function fallbackWindowsToWslPath(hostPath: string): string {
-  const match = hostPath.match(/^([A-Za-z]):[/\\](.*)$/);
+  const match = WINDOWS_DRIVE_PATH_RE.exec(hostPath);
   if (!match) {
     return hostPath;
   }
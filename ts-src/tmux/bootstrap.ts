@@ -2,6 +2,7 @@ import { runCommand } from '../runtime/shell.js';
 import { logger } from '../utils/logger.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { Platform, detectPlatform } from '../runtime/platform.js';
+import { buildWslExecCommand } from '../runtime/wsl.js';
 
 export interface BootstrapResult {
   tmuxAvailable: boolean;
@@ -19,27 +20,24 @@ const INSTALL_COMMANDS: Record<string, string> = {
   macos: 'brew install tmux',
 };
 
+// One alternation per family scans the os-release text once instead of once per id.
+// ID_LIKE=debian / ID_LIKE=arch lines contain the family id itself, so they match too.
+const DEBIAN_IDS_RE = /debian|ubuntu|pengwin|kali|mint|pop|elementary|zorin/;
+const RHEL_IDS_RE = /fedora|rhel|centos|rocky|almalinux|oracle|amazon/;
+const ARCH_IDS_RE = /arch|manjaro|endeavouros|garuda/;
+
 function getInstallCommand(osRelease: string): string {
   const lowered = osRelease.toLowerCase();
 
-  const debianIds = ['debian', 'ubuntu', 'pengwin', 'kali', 'mint', 'pop', 'elementary', 'zorin'];
-  if (
-    debianIds.some((name) => lowered.includes(name)) ||
-    lowered.replace(/\s/g, '').includes('id_like=debian')
-  ) {
+  if (DEBIAN_IDS_RE.test(lowered)) {
     return INSTALL_COMMANDS['debian'];
   }
 
-  const rhelIds = ['fedora', 'rhel', 'centos', 'rocky', 'almalinux', 'oracle', 'amazon'];
-  if (rhelIds.some((name) => lowered.includes(name))) {
+  if (RHEL_IDS_RE.test(lowered)) {
     return INSTALL_COMMANDS['fedora'];
   }
 
-  const archIds = ['arch', 'manjaro', 'endeavouros', 'garuda'];
-  if (
-    archIds.some((name) => lowered.includes(name)) ||
-    lowered.replace(/\s/g, '').includes('id_like=arch')
-  ) {
+  if (ARCH_IDS_RE.test(lowered)) {
     return INSTALL_COMMANDS['arch'];
   }
 
@@ -70,6 +68,12 @@ function getInstallCommand(osRelease: string): string {
   );
 }
 
+const WSL_TMUX_PROBE_SCRIPT =
+  'command -v tmux >/dev/null 2>&1 && exit 0; cat /etc/os-release; exit 1';
+
+// Distributions where tmux was found or installed; later checks skip the wsl.exe probe
+const tmuxReadyDistributions = new Set<string>();
+
 function getManualInstallGuidance(osRelease: string): string {
   try {
     const cmd = getInstallCommand(osRelease);
@@ -83,23 +87,31 @@ export async function ensureTmux(
   distribution: string,
   options?: { autoInstall?: boolean }
 ): Promise<BootstrapResult> {
+  if (tmuxReadyDistributions.has(distribution)) {
+    return { tmuxAvailable: true, installAttempted: false };
+  }
+
   logger.debug(`Checking tmux availability in distribution=${distribution}`);
 
   const isWindows = detectPlatform() === Platform.WINDOWS;
 
+  // On WSL one shell both probes for tmux and, when it is missing, prints os-release,
+  // so the install path does not need a second wsl.exe start. --exec keeps the script one
+  // argument; the default shell would split it at `;`
   const checkCommand = isWindows
-    ? ['wsl.exe', '-d', distribution, '--', 'command', '-v', 'tmux']
-    : ['tmux'];
+    ? buildWslExecCommand(distribution, ['sh', '-c', WSL_TMUX_PROBE_SCRIPT])
+    : ['command', '-v', 'tmux'];
+  let probeOutput: string | null = null;
 
   try {
-    const result = isWindows
-      ? await runCommand(checkCommand)
-      : await runCommand(['command', '-v', 'tmux']);
+    const result = await runCommand(checkCommand);
 
     if (result.exitCode === 0) {
       logger.debug(`tmux is already installed`);
+      tmuxReadyDistributions.add(distribution);
       return { tmuxAvailable: true, installAttempted: false };
     }
+    probeOutput = result.stdout;
   } catch {
     // Continue to install attempt
   }
@@ -114,15 +126,7 @@ export async function ensureTmux(
 
   let osRelease = '';
   if (isWindows) {
-    const osReleaseResult = await runCommand([
-      'wsl.exe',
-      '-d',
-      distribution,
-      '--',
-      'cat',
-      '/etc/os-release',
-    ]);
-    osRelease = osReleaseResult.stdout;
+    osRelease = probeOutput ?? '';
   } else if (detectPlatform() === Platform.MACOS) {
     osRelease = 'macos';
   } else {
@@ -148,6 +152,7 @@ export async function ensureTmux(
 
   if (nonInteractiveResult.exitCode === 0) {
     logger.info('Non-interactive tmux install succeeded');
+    tmuxReadyDistributions.add(distribution);
     return { tmuxAvailable: true, installAttempted: true };
   }
 
@@ -1,6 +1,12 @@
 export { ensureTmux, type BootstrapResult } from './bootstrap.js';
 
-export { validateLayout, buildLayoutCommands, mapPaneTargets, type PaneTarget } from './layouts.js';
+export {
+  validateLayout,
+  buildLayoutCommands,
+  chainTmuxCommands,
+  mapPaneTargets,
+  type PaneTarget,
+} from './layouts.js';
 
 export {
   startSession,
@@ -148,3 +148,38 @@ export function mapPaneTargets(panePaths: string[]): PaneTarget[] {
     worktreePath: path,
   }));
 }
+
+function escapeTmuxSeparator(arg: string): string {
+  // A trailing ';' would end the command when chained; '\;' keeps it literal
+  return arg.endsWith(';') ? `${arg.slice(0, -1)}\\;` : arg;
+}
+
+/**
+ * Folds consecutive tmux commands into a single `tmux a ; b ; c` invocation so
+ * a session is configured with one process spawn instead of one per command.
+ */
+export function chainTmuxCommands(commands: string[][]): string[][] {
+  const chained: string[][] = [];
+  let current: string[] | null = null;
+
+  for (const command of commands) {
+    if (command[0] !== 'tmux') {
+      chained.push(command);
+      current = null;
+      continue;
+    }
+
+    if (current === null) {
+      current = ['tmux'];
+      chained.push(current);
+    } else {
+      current.push(';');
+    }
+    // Escape straight into the chained argv instead of via sliced/mapped copies
+    for (let i = 1; i < command.length; i++) {
+      current.push(escapeTmuxSeparator(command[i]));
+    }
+  }
+
+  return chained;
+}
@@ -1,47 +1,58 @@
 import { runCommand, runCommandViaWSL } from '../runtime/shell.js';
-import { buildWslCommand } from '../runtime/wsl.js';
+import { buildWslExecCommand } from '../runtime/wsl.js';
 import { logger } from '../utils/logger.js';
 import { BranchNexusError, ExitCode } from '../types/errors.js';
 import { Platform, detectPlatform } from '../runtime/platform.js';
 import { hasDistribution } from '../utils/validators.js';
+import { chainTmuxCommands } from './layouts.js';
 
 const DEFAULT_SESSION_NAME = 'branch-nexus';
+const DUPLICATE_SESSION_RE = /duplicate session/i;
+
+/**
+ * Wraps a (possibly chained) tmux argv for the current platform. On Windows the
+ * command runs via `wsl.exe --exec`, bypassing the login shell that would
+ * otherwise split a chained `tmux a ; b` at the `;`.
+ */
+export function wrapTmuxCommand(command: string[], distribution?: string): string[] {
+  if (detectPlatform() === Platform.WINDOWS && hasDistribution(distribution)) {
+    return buildWslExecCommand(distribution, command);
+  }
+  return command;
+}
 
 export async function startSession(
   sessionName: string,
   commands: string[][],
   distribution?: string
 ): Promise<void> {
-  const isWindows = detectPlatform() === Platform.WINDOWS;
-
   logger.debug(`Starting tmux session: ${sessionName}`);
 
-  for (const command of commands) {
-    const wrappedCommand =
-      isWindows && hasDistribution(distribution) ? buildWslCommand(distribution, command) : command;
+  // new-session runs on its own so a duplicate session can be replaced and retried;
+  // the remaining configuration commands are chained into a single tmux call
+  const [first, ...rest] = commands;
+  const batches = first === undefined ? [] : [first, ...chainTmuxCommands(rest)];
 
-    logger.debug(`Executing tmux command: ${wrappedCommand.join(' ')}`);
+  for (const command of batches) {
+    const wrappedCommand = wrapTmuxCommand(command, distribution);
 
-    const result =
-      isWindows && hasDistribution(distribution)
-        ? await runCommandViaWSL(distribution, command)
-        : await runCommand(wrappedCommand);
+    // The wrapped argv is built once and reused for logging, the run and any retry
+    logger.debug(() => `Executing tmux command: ${wrappedCommand.join(' ')}`);
+
+    const result = await runCommand(wrappedCommand);
 
     if (result.exitCode !== 0) {
       const stderr = result.stderr.trim();
 
       // Check for duplicate session
       const isNewSession = command[0] === 'tmux' && command[1] === 'new-session';
-      if (isNewSession && stderr.toLowerCase().includes('duplicate session')) {
+      if (isNewSession && DUPLICATE_SESSION_RE.test(stderr)) {
         logger.warn(`tmux session already exists: ${sessionName}, replacing`);
 
         // Kill existing session and retry
         await killSession(sessionName, distribution);
 
-        const retryResult =
-          isWindows && hasDistribution(distribution)
-            ? await runCommandViaWSL(distribution, command)
-            : await runCommand(wrappedCommand);
+        const retryResult = await runCommand(wrappedCommand);
 
         if (retryResult.exitCode !== 0) {
           throw new BranchNexusError(
@@ -23,7 +23,7 @@ export { ExitCode, BranchNexusError, userFacingError, isBranchNexusError } from
 
 export type { WorktreeAssignment, ManagedWorktree } from './worktree.js';
 
-export { createWorktreeAssignment, createManagedWorktree } from './worktree.js';
+export { createWorktreeAssignment, createManagedWorktree, sortByPane } from './worktree.js';
 
 export type {
   RuntimeKind,
@@ -30,3 +30,16 @@ export function createManagedWorktree(
     path,
   };
 }
+
+/**
+ * Orders items by pane index in place, skipping the sort when they are
+ * already ascending (the usual case, since panes are assigned in order).
+ */
+export function sortByPane<T extends { pane: number }>(items: T[]): T[] {
+  for (let i = 1; i < items.length; i++) {
+    if (items[i - 1].pane > items[i].pane) {
+      return items.sort((a, b) => a.pane - b.pane);
+    }
+  }
+  return items;
+}
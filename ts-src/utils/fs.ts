@@ -1,5 +1,5 @@
 import { resolve, dirname } from 'node:path';
-import { existsSync, mkdirSync } from 'node:fs';
+import { mkdirSync } from 'node:fs';
 import { homedir } from 'node:os';
 
 export function expandHomeDir(filepath: string): string {
@@ -11,9 +11,7 @@ export function expandHomeDir(filepath: string): string {
 
 export function ensureDir(dir: string): string {
   const expanded = expandHomeDir(dir);
-  if (!existsSync(expanded)) {
-    mkdirSync(expanded, { recursive: true });
-  }
+  mkdirSync(expanded, { recursive: true });
   return expanded;
 }
 
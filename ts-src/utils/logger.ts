@@ -1,9 +1,12 @@
-import { appendFileSync, mkdirSync, existsSync, writeFileSync } from 'node:fs';
+import { closeSync, mkdirSync, openSync, writeSync } from 'node:fs';
 import { dirname, resolve } from 'node:path';
 import { homedir } from 'node:os';
 
 export type LogLevel = 'debug' | 'info' | 'warn' | 'error';
 
+/** A message, or a factory that is only invoked when the level is enabled */
+export type LogMessage = string | (() => string);
+
 const LOG_LEVELS: Record<LogLevel, number> = {
   debug: 0,
   info: 1,
@@ -12,7 +15,8 @@ const LOG_LEVELS: Record<LogLevel, number> = {
 };
 
 let currentLevel: LogLevel = 'info';
-let logFilePath: string | null = null;
+// Kept open so each log line is a single write instead of open + write + close
+let logFd: number | null = null;
 
 const DEFAULT_LOG_DIR = '.config/branch-nexus/logs';
 const DEFAULT_LOG_FILE = 'branch-nexus.log';
@@ -27,27 +31,62 @@ export function configureLogging(options?: { level?: LogLevel; logFile?: string
     currentLevel = options.level;
   }
   if (options?.logFile !== undefined && options.logFile !== '') {
-    logFilePath = resolve(options.logFile);
-    const logDir = dirname(logFilePath);
-    if (!existsSync(logDir)) {
-      mkdirSync(logDir, { recursive: true });
+    const logFilePath = resolve(options.logFile);
+    mkdirSync(dirname(logFilePath), { recursive: true });
+    openLogFile(logFilePath, 'a');
+  }
+}
+
+function openLogFile(path: string, flags: 'a' | 'w'): void {
+  if (logFd !== null) {
+    try {
+      closeSync(logFd);
+    } catch {
+      // Ignore close errors
     }
+    logFd = null;
+  }
+
+  try {
+    logFd = openSync(path, flags);
+  } catch {
+    // Ignore open errors; file logging is best-effort
   }
 }
 
+const LEVEL_LABELS: Record<LogLevel, string> = {
+  debug: 'DEBUG',
+  info: 'INFO',
+  warn: 'WARN',
+  error: 'ERROR',
+};
+
+// Bursts of log lines usually land in the same millisecond; reuse its timestamp
+let lastStampMs = -1;
+let lastStamp = '';
+
+function timestamp(): string {
+  const now = Date.now();
+  if (now !== lastStampMs) {
+    lastStampMs = now;
+    lastStamp = new Date(now).toISOString();
+  }
+  return lastStamp;
+}
+
 function formatMessage(level: LogLevel, message: string, args: unknown[]): string {
-  const timestamp = new Date().toISOString();
   const formattedArgs =
     args.length > 0 ? ' ' + args.map((arg) => JSON.stringify(arg)).join(' ') : '';
-  return `${timestamp} ${level.toUpperCase()} ${message}${formattedArgs}`;
+  return `${timestamp()} ${LEVEL_LABELS[level]} ${message}${formattedArgs}`;
 }
 
-function log(level: LogLevel, message: string, args: unknown[]): void {
+function log(level: LogLevel, message: LogMessage, args: unknown[]): void {
   if (LOG_LEVELS[level] < LOG_LEVELS[currentLevel]) {
     return;
   }
 
-  const formatted = formatMessage(level, message, args);
+  const text = typeof message === 'function' ? message() : message;
+  const formatted = formatMessage(level, text, args);
 
   if (level === 'error') {
     console.error(formatted);
@@ -57,9 +96,9 @@ function log(level: LogLevel, message: string, args: unknown[]): void {
     console.log(formatted);
   }
 
-  if (logFilePath !== null) {
+  if (logFd !== null) {
     try {
-      appendFileSync(logFilePath, formatted + '\n', 'utf-8');
+      writeSync(logFd, formatted + '\n');
     } catch {
       // Ignore file write errors
     }
@@ -67,25 +106,22 @@ function log(level: LogLevel, message: string, args: unknown[]): void {
 }
 
 export const logger = {
-  debug: (message: string, ...args: unknown[]): void => {
+  debug: (message: LogMessage, ...args: unknown[]): void => {
     log('debug', message, args);
   },
-  info: (message: string, ...args: unknown[]): void => {
+  info: (message: LogMessage, ...args: unknown[]): void => {
     log('info', message, args);
   },
-  warn: (message: string, ...args: unknown[]): void => {
+  warn: (message: LogMessage, ...args: unknown[]): void => {
     log('warn', message, args);
   },
-  error: (message: string, ...args: unknown[]): void => {
+  error: (message: LogMessage, ...args: unknown[]): void => {
     log('error', message, args);
   },
 };
 
 export function createFileLogger(logFile: string): void {
-  logFilePath = resolve(logFile);
-  const logDir = dirname(logFilePath);
-  if (!existsSync(logDir)) {
-    mkdirSync(logDir, { recursive: true });
-  }
-  writeFileSync(logFilePath, '', 'utf-8');
+  const logFilePath = resolve(logFile);
+  mkdirSync(dirname(logFilePath), { recursive: true });
+  openLogFile(logFilePath, 'w');
 }
@@ -20,6 +20,10 @@ export {
   type PresetConfig,
 };
 
+// Enum members are fixed, so membership is a set lookup instead of a schema parse
+const LAYOUT_VALUES: ReadonlySet<string> = new Set(LayoutSchema.options);
+const CLEANUP_POLICY_VALUES: ReadonlySet<string> = new Set(CleanupPolicySchema.options);
+
 export function validateConfig(config: unknown): AppConfig {
   return AppConfigSchema.parse(config);
 }
@@ -37,11 +41,11 @@ export function validatePresetConfig(config: unknown): PresetConfig {
 }
 
 export function isValidLayout(value: string): value is Layout {
-  return LayoutSchema.safeParse(value).success;
+  return LAYOUT_VALUES.has(value);
 }
 
 export function isValidCleanupPolicy(value: string): value is CleanupPolicy {
-  return CleanupPolicySchema.safeParse(value).success;
+  return CLEANUP_POLICY_VALUES.has(value);
 }
 
 export function isValidPaneCount(value: number): boolean {
@@ -57,20 +61,30 @@ export function hasDistribution(dist?: string): dist is string {
 }
 
 const SANITIZE_PATTERN = /[^A-Za-z0-9._-]+/g;
+// Already-clean segments (the common case) skip the rewrite entirely
+const VALID_SEGMENT_PATTERN = /^[A-Za-z0-9._](?:[A-Za-z0-9._-]*[A-Za-z0-9._])?$/;
+const HYPHEN = 0x2d;
 
 export function sanitizePathSegment(value: string): string {
-  const cleaned = value.replace(SANITIZE_PATTERN, '-').replace(/^-+|-+$/g, '');
-  return cleaned || 'default';
+  if (VALID_SEGMENT_PATTERN.test(value)) {
+    return value;
+  }
+
+  const cleaned = value.replace(SANITIZE_PATTERN, '-');
+  // Trim edge hyphens by index; a /^-+|-+$/ pass backtracks quadratically on long inner hyphen runs
+  let start = 0;
+  let end = cleaned.length;
+  while (start < end && cleaned.charCodeAt(start) === HYPHEN) start++;
+  while (end > start && cleaned.charCodeAt(end - 1) === HYPHEN) end--;
+  return cleaned.slice(start, end) || 'default';
 }
 
 export function normalizePath(path: string): string {
   return path.replace(/\\/g, '/');
 }
 
+const LEADING_SLASHES_PATTERN = /^\/{2,}/;
+
 export function posixPath(path: string): string {
-  let normalized = normalizePath(path);
-  while (normalized.startsWith('//')) {
-    normalized = normalized.slice(1);
-  }
-  return normalized;
+  return normalizePath(path).replace(LEADING_SLASHES_PATTERN, '/');
 }